@@ -0,0 +1,250 @@
+"""Async (ASGI) variant of the prediction API.
+
+Same /api routes and JSON as run.py, as a plain ASGI app with no framework:
+
+    python asgi.py                      # uvicorn on port 8080
+    uvicorn asgi:app --workers 4        # or any ASGI server
+
+Batch scoring runs in a thread pool so the event loop keeps accepting
+requests. With ASYNC_MICROBATCH=1, /api/predict requests arriving within a
+couple of milliseconds are scored together in one vectorized call (see
+predictor.microbatch). The frontend is not served here; put it behind a
+static file server or use run.py.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from predictor import codec
+from predictor.batch import BatchError, parse_batch_body, score_batch, score_batch_columns
+from predictor.loader import model_version
+from predictor.logs import log_error, log_prediction, setup_logging
+from predictor.metrics import (CONTENT_TYPE, REGISTRY, record_prediction, record_request,
+                               record_stages, register_service)
+from predictor.microbatch import AsyncMicroBatcher
+from predictor.registry import admin_allowed
+from predictor.responses import prediction_payload, wants_compact
+from predictor.service import SAMPLE_DATA, PredictionService
+from predictor.surface import SurfaceError, render as render_surface
+
+PORT = int(os.environ.get('PORT', 8080))
+MICROBATCH = os.environ.get('ASYNC_MICROBATCH', '0') == '1'
+SCORING_THREADS = int(os.environ.get('SCORING_THREADS', 2))
+
+print("🚀 Starting ML Placement Predictor (async)...")
+
+# Batching here happens on the event loop, not in the service's worker thread
+setup_logging()
+service = PredictionService('backend/model.pkl', microbatch=False).load()
+register_service(service)
+
+executor = ThreadPoolExecutor(SCORING_THREADS, thread_name_prefix='scoring')
+batcher = None  # created on the first request, inside the server's event loop
+
+
+class Request:
+    def __init__(self, scope, body):
+        self.scope = scope
+        self.body = body
+        self.headers = {k.decode('latin-1'): v.decode('latin-1') for k, v in scope['headers']}
+        self.args = {k: v[0] for k, v in parse_qs(scope.get('query_string', b'').decode()).items()}
+
+    @property
+    def remote_addr(self):
+        client = self.scope.get('client')
+        return client[0] if client else None
+
+    @property
+    def mimetype(self):
+        return self.headers.get('content-type', '').split(';')[0].strip().lower()
+
+
+def json_response(data, status=200, headers=()):
+    return status, codec.dumps(data), [('content-type', 'application/json'), *headers]
+
+
+async def predict(request):
+    try:
+        t0 = time.perf_counter()
+        cgpa, iq = codec.parse_student(request.body)
+        t1 = time.perf_counter()
+
+        if batcher is not None and service.models.model is not None:
+            prediction, probability, model = await batcher.predict(cgpa, iq)
+            model_type = "real"
+            service.observe(cgpa, iq, prediction, probability)
+        else:
+            prediction, probability, model_type, model = service.predict(cgpa, iq)
+        t2 = time.perf_counter()
+
+        response = json_response(prediction_payload(cgpa, iq, prediction, probability, model_type,
+                                                    model_version(model), compact=wants_compact(request.args)))
+        record_stages('/api/predict', parse=t1 - t0, inference=t2 - t1, serialize=time.perf_counter() - t2)
+        record_prediction(model_type)
+        log_prediction(cgpa, iq, prediction, probability, model_type)
+        return response
+    except Exception as e:
+        log_error("Prediction error: %s", e)
+        return json_response({'error': str(e)}, 400)
+
+
+def _parse_and_score(model, body, mimetype, compact):
+    """(X, payload, parse seconds, inference seconds); runs in the executor."""
+    t0 = time.perf_counter()
+    X = parse_batch_body(body, mimetype)
+    t1 = time.perf_counter()
+    if compact:
+        payload = {'count': len(X), **score_batch_columns(model, X, service.monitor)}
+    else:
+        payload = {'success': True, 'count': len(X), 'results': score_batch(model, X, service.monitor)}
+    return X, payload, t1 - t0, time.perf_counter() - t1
+
+
+async def predict_batch(request):
+    model = service.models.model
+    if model is None:
+        return json_response({'error': 'Model not loaded'}, 503)
+    if request.mimetype.startswith('multipart/'):
+        return json_response({'error': 'Send the file as a text/csv or NDJSON body'}, 415)
+    # Decoding and validating up to MAX_BATCH_SIZE rows would stall the event loop too
+    try:
+        X, payload, parse_seconds, inference_seconds = await asyncio.get_running_loop().run_in_executor(
+            executor, _parse_and_score, model, request.body, request.mimetype, wants_compact(request.args))
+    except BatchError as e:
+        return json_response({'error': str(e)}, e.status)
+    payload['model_version'] = model_version(model)
+    t2 = time.perf_counter()
+    response = json_response(payload)
+    record_stages('/api/predict/batch', parse=parse_seconds, inference=inference_seconds,
+                  serialize=time.perf_counter() - t2)
+    record_prediction('real', count=len(X), kind='batch')
+    return response
+
+
+async def api_status(request):
+    return json_response({**service.status(),
+                          'microbatch': batcher.stats() if batcher is not None else None})
+
+
+async def admin_reload(request):
+    # Loads in a background thread; ?wait=1 waits for the swap without blocking the loop
+    if not admin_allowed(request):
+        return json_response({'error': 'Forbidden'}, 403)
+    wait = request.args.get('wait') == '1'
+    await asyncio.get_running_loop().run_in_executor(executor, service.models.reload, wait)
+    return json_response({'success': True, **service.models.status()}, 200 if wait else 202)
+
+
+async def stats(request):
+    # The first call (or a changed CSV) reads the dataset, so keep it off the event loop
+    payload, etag = await asyncio.get_running_loop().run_in_executor(executor, service.stats_snapshot)
+    if etag is None:
+        return json_response(payload)
+    headers = [('etag', f'"{etag}"'), ('cache-control', 'no-cache')]
+    if f'"{etag}"' in request.headers.get('if-none-match', ''):
+        return 304, b'', headers
+    return json_response(payload, headers=headers)
+
+
+async def client_model(request):
+    payload, etag = service.client_model()
+    if payload is None:
+        return json_response({'error': 'Model not loaded'}, 503)
+    headers = [('etag', f'"{etag}"'), ('cache-control', 'no-cache')]
+    if f'"{etag}"' in request.headers.get('if-none-match', ''):
+        return 304, b'', headers
+    return json_response(payload, headers=headers)
+
+
+async def surface(request):
+    # Binning the dataset for points=1 reads the CSV on a cache miss
+    try:
+        body, content_type, headers, etag = await asyncio.get_running_loop().run_in_executor(
+            executor, render_surface, service, request.args)
+    except SurfaceError as e:
+        return json_response({'error': str(e)}, e.status)
+    headers = [('content-type', content_type), ('etag', f'"{etag}"'), ('cache-control', 'no-cache'),
+               *((k.lower(), v) for k, v in headers.items())]
+    if f'"{etag}"' in request.headers.get('if-none-match', ''):
+        return 304, b'', headers[1:]
+    return 200, body, headers
+
+
+async def drift(request):
+    report = await asyncio.get_running_loop().run_in_executor(executor, service.drift_report)
+    if report is None:
+        return json_response({'error': 'Drift monitoring is off (DRIFT_MONITOR=0)'}, 404)
+    return json_response(report)
+
+
+async def sample_data(request):
+    return json_response(SAMPLE_DATA)
+
+
+async def metrics(request):
+    return 200, REGISTRY.render().encode(), [('content-type', CONTENT_TYPE)]
+
+
+ROUTES = {
+    ('POST', '/api/predict'): predict,
+    ('POST', '/api/predict/batch'): predict_batch,
+    ('GET', '/api/status'): api_status,
+    ('POST', '/api/admin/reload'): admin_reload,
+    ('GET', '/api/stats'): stats,
+    ('GET', '/api/model'): client_model,
+    ('GET', '/api/surface'): surface,
+    ('GET', '/api/drift'): drift,
+    ('GET', '/api/sample-data'): sample_data,
+    ('GET', '/metrics'): metrics,
+}
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def app(scope, receive, send):
+    global batcher
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    if scope['type'] != 'http':
+        return
+
+    if MICROBATCH and batcher is None:
+        batcher = AsyncMicroBatcher(lambda: service.models.model, executor=executor)
+
+    started = time.perf_counter()
+    handler = ROUTES.get((scope['method'], scope['path']))
+    if handler is None:
+        methods = [m for m, p in ROUTES if p == scope['path']]
+        status, body, headers = json_response({'error': 'Not found' if not methods else 'Method not allowed'},
+                                              404 if not methods else 405)
+    else:
+        request = Request(scope, await read_body(receive))
+        status, body, headers = await handler(request)
+
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(k.encode(), v.encode()) for k, v in headers]})
+    await send({'type': 'http.response.body', 'body': body})
+    record_request(scope['path'] if handler is not None else 'unmatched', scope['method'], status,
+                   time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, host='0.0.0.0', port=PORT, log_level='warning')
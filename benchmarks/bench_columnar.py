@@ -0,0 +1,60 @@
+"""Cold-start /api/stats cost: parsing the CSV vs. the columnar .npy cache.
+
+    python benchmarks/bench_columnar.py [--rows 100,1000000,10000000]
+
+For each size a synthetic CSV is written, then a fresh interpreter times
+the first DatasetStats snapshot, once before and once after
+`python -m predictor.columnar` has converted the file.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+FIRST_HIT = r'''
+import sys, time
+sys.path.insert(0, {root!r})
+t = time.perf_counter()
+from predictor.stats import DatasetStats
+stats = DatasetStats({path!r})
+payload, _ = stats.snapshot()
+print(payload['total_students'], time.perf_counter() - t, stats.columnar_loads)
+'''
+
+
+def cold_start(path):
+    """(rows, seconds to first snapshot, columnar used) in a fresh interpreter."""
+    code = FIRST_HIT.format(root=ROOT, path=path)
+    out = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    rows, seconds, columnar = out.stdout.split()
+    return int(rows), float(seconds), columnar != '0'
+
+
+def main():
+    from benchmarks.synth import write_synthetic_csv
+    from predictor.columnar import convert
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', default='100,1000000,10000000')
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'csv (s)':>9} {'columnar (s)':>13} {'convert (s)':>12} {'speedup':>8}")
+    for rows in [int(r) for r in args.rows.split(',')]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_synthetic_csv(os.path.join(tmp, 'placement.csv'), rows)
+            _, csv_s, _ = cold_start(path)
+            t = time.perf_counter()
+            convert(path)
+            convert_s = time.perf_counter() - t
+            n, col_s, used = cold_start(path)
+            assert n == rows and used, 'columnar cache was not used'
+            print(f"{rows:>10} {csv_s:>9.3f} {col_s:>13.3f} {convert_s:>12.2f} {csv_s / col_s:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
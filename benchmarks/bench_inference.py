@@ -0,0 +1,58 @@
+"""Compare the old predict() + predict_proba() double call with predict_one().
+
+Also times predict_one() on the compiled scorer (model.scorer.json) when
+one has been exported next to the model.
+
+Run from the repository root:
+
+    python benchmarks/bench_inference.py [--model backend/model.pkl] [--n 5000]
+"""
+import argparse
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from predictor.inference import predict_one  # noqa: E402
+from predictor.scorer import CompiledScorer, scorer_path_for  # noqa: E402
+
+
+def double_call(model, cgpa, iq):
+    prediction = model.predict([[cgpa, iq]])[0]
+    probability = float(model.predict_proba([[cgpa, iq]])[0][prediction])
+    return prediction, probability
+
+
+def bench(fn, n, repeat=5):
+    """Best-of-repeat time per call, in microseconds."""
+    best = min(timeit.repeat(fn, number=n, repeat=repeat))
+    return best / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default='backend/model.pkl')
+    parser.add_argument('--n', type=int, default=5000)
+    args = parser.parse_args()
+
+    with open(args.model, 'rb') as f:
+        model = pickle.load(f)
+
+    old = bench(lambda: double_call(model, 7.5, 130.0), args.n)
+    new = bench(lambda: predict_one(model, 7.5, 130.0), args.n)
+    print(f"predict + predict_proba : {old:8.1f} us/call")
+    print(f"predict_one             : {new:8.1f} us/call")
+    print(f"speedup                 : {old / new:8.2f}x")
+
+    scorer_path = scorer_path_for(args.model)
+    if os.path.exists(scorer_path):
+        scorer = CompiledScorer.load(scorer_path)
+        compiled = bench(lambda: predict_one(scorer, 7.5, 130.0), args.n)
+        print(f"predict_one (compiled)  : {compiled:8.1f} us/call")
+        print(f"speedup vs double call  : {old / compiled:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
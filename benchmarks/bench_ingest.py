@@ -0,0 +1,67 @@
+"""Peak memory of chunked ingestion vs. reading the whole CSV with pandas.
+
+    python benchmarks/bench_ingest.py [--rows 2000000] [--chunk-rows 100000]
+
+Each mode runs in a fresh interpreter and reports its peak RSS above the
+baseline after imports. The chunked mode should stay roughly flat as
+--rows grows; the full read grows with the file.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+MEASURE = r'''
+import resource, sys, time
+sys.path.insert(0, {root!r})
+import numpy as np, pandas as pd
+from predictor.dataset import iter_chunks
+from predictor.stats import Aggregates
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+base = rss_mb()
+t = time.perf_counter()
+if {mode!r} == 'chunks':
+    agg = Aggregates()
+    for chunk in iter_chunks({path!r}, chunksize={chunk_rows}):
+        agg.add_chunk(chunk['cgpa'].to_numpy(), chunk['iq'].to_numpy(), chunk['placement'].to_numpy())
+    rows = agg.count
+else:
+    df = pd.read_csv({path!r})
+    rows = len(df)
+print(rows, time.perf_counter() - t, rss_mb() - base)
+'''
+
+
+def measure(mode, path, chunk_rows):
+    code = MEASURE.format(root=ROOT, mode=mode, path=path, chunk_rows=chunk_rows)
+    out = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    rows, seconds, peak = out.stdout.split()
+    return int(rows), float(seconds), float(peak)
+
+
+def main():
+    from benchmarks.synth import write_synthetic_csv
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000000)
+    parser.add_argument('--chunk-rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_csv(os.path.join(tmp, 'placement.csv'), args.rows)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"📄 {args.rows} rows, {size_mb:.1f} MB")
+        for mode in ('chunks', 'full'):
+            rows, seconds, peak = measure(mode, path, args.chunk_rows)
+            print(f"{mode:7s}: {rows} rows in {seconds:6.2f}s, peak +{peak:7.1f} MB RSS")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Load test: POST /api/predict against serve.py with N preforked workers.
+
+    python benchmarks/bench_load.py [--workers 1,2,4] [--clients 16] [--seconds 5]
+
+Each configuration starts a fresh `serve.py`, waits for /api/status, then
+runs --clients keep-alive HTTP clients (threads) for --seconds and reports
+requests/s and latency percentiles.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/api/status')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'server on port {port} did not come up')
+
+
+def client(port, stop, latencies, errors):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    rng = random.Random()
+    headers = {'Content-Type': 'application/json'}
+    while not stop.is_set():
+        body = json.dumps({'cgpa': round(rng.uniform(4, 10), 2), 'iq': rng.randint(70, 160)})
+        t = time.perf_counter()
+        try:
+            conn.request('POST', '/api/predict', body, headers)
+            resp = conn.getresponse()
+            resp.read()
+            if resp.status != 200:
+                errors.append(resp.status)
+        except OSError as e:
+            errors.append(str(e))
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - t)
+    conn.close()
+
+
+def run_load(workers, threads, clients, seconds):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'serve.py'), '--port', str(port),
+         '--workers', str(workers), '--threads', str(threads), '--host', '127.0.0.1'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port)
+        stop = threading.Event()
+        latencies, errors = [], []
+        pool = [threading.Thread(target=client, args=(port, stop, latencies, errors)) for _ in range(clients)]
+        for t in pool:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in pool:
+            t.join()
+    finally:
+        server.terminate()  # graceful shutdown
+        server.wait(timeout=60)
+    latencies.sort()
+    pct = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else float('nan')
+    return len(latencies) / seconds, pct(0.50), pct(0.99), len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', default='1,2,4')
+    parser.add_argument('--threads', type=int, default=2)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    print(f"CPU cores: {os.cpu_count()}, clients: {args.clients}, threads/worker: {args.threads}")
+    print(f"{'workers':>8} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'errors':>7}")
+    for workers in [int(w) for w in args.workers.split(',')]:
+        rps, p50, p99, errors = run_load(workers, args.threads, args.clients, args.seconds)
+        print(f"{workers:>8} {rps:>9.0f} {p50:>9.2f} {p99:>9.2f} {errors:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""Benchmark suite: single predict, batch predict, stats and static files.
+
+    python benchmarks/bench_suite.py [--rows 100000] [--requests 2000] [--mode both]
+                                     [--out results.json] [--compare baseline.json]
+
+Runs offline against a synthetic placement.csv (benchmarks/synth.py) of
+--rows students. Each scenario is measured in-process through the Flask
+test client and over HTTP against a local threaded server, reporting
+p50/p95/p99 latency, requests/s and RSS. Results are written as JSON so
+two commits can be compared with --compare.
+"""
+import argparse
+import datetime
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, ROOT)
+
+MODEL = os.path.join(ROOT, 'backend', 'model.pkl')
+FRONTEND = os.path.join(ROOT, 'frontend')
+BATCH_SIZE = 100
+
+SERVER = r'''
+import sys
+sys.path.insert(0, {root!r})
+from werkzeug.serving import make_server
+from predictor.app import create_app
+app = create_app({model!r}, static_dir={frontend!r}, dataset_dir={data_dir!r})
+app.extensions['predictor'].warm_up()
+server = make_server('127.0.0.1', {port}, app, threaded=True)
+print('ready', flush=True)
+server.serve_forever()
+'''
+
+
+def scenarios(seed=0):
+    """name -> function returning (method, path, body, content type) for the next request."""
+    rng = random.Random(seed)
+
+    def student():
+        return {'cgpa': round(rng.uniform(4, 10), 1), 'iq': rng.randint(70, 160)}
+
+    return {
+        'predict': lambda: ('POST', '/api/predict', json.dumps(student()), 'application/json'),
+        'batch': lambda: ('POST', '/api/predict/batch',
+                          json.dumps([student() for _ in range(BATCH_SIZE)]), 'application/json'),
+        'stats': lambda: ('GET', '/api/stats', None, None),
+        'static': lambda: ('GET', '/script.js', None, None),
+    }
+
+
+def rss_mb(pid='self'):
+    """Current resident set size of a process (Linux), else peak RSS of this one."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if pid == 'self':
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return None
+
+
+def summarize(latencies, seconds, errors, rss):
+    latencies = sorted(latencies)
+
+    def pct(q):
+        if not latencies:
+            return None
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3)
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'p50_ms': pct(0.50),
+        'p95_ms': pct(0.95),
+        'p99_ms': pct(0.99),
+        'rps': round(len(latencies) / seconds, 1) if seconds else None,
+        'rss_mb': round(rss, 1) if rss is not None else None,
+    }
+
+
+def run_inprocess(app, make_request, n):
+    client = app.test_client()
+    latencies, errors = [], 0
+    start = time.perf_counter()
+    for _ in range(n):
+        method, path, body, ctype = make_request()
+        t = time.perf_counter()
+        response = client.open(path, method=method, data=body, content_type=ctype)
+        response.get_data()
+        latencies.append(time.perf_counter() - t)
+        errors += response.status_code >= 400
+    return summarize(latencies, time.perf_counter() - start, errors, rss_mb())
+
+
+def run_http(port, make_request, n, clients, server_pid):
+    latencies, errors = [], []
+    lock = threading.Lock()
+    remaining = [n]
+
+    def worker():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        while True:
+            with lock:
+                if remaining[0] == 0:
+                    break
+                remaining[0] -= 1
+                method, path, body, ctype = make_request()
+            headers = {'Content-Type': ctype} if ctype else {}
+            t = time.perf_counter()
+            conn.request(method, path, body, headers)
+            response = conn.getresponse()
+            response.read()
+            elapsed = time.perf_counter() - t
+            with lock:
+                latencies.append(elapsed)
+                if response.status >= 400:
+                    errors.append(response.status)
+        conn.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return summarize(latencies, time.perf_counter() - start, len(errors), rss_mb(server_pid))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(data_dir):
+    port = free_port()
+    code = SERVER.format(root=ROOT, model=MODEL, frontend=FRONTEND, data_dir=data_dir, port=port)
+    server = subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True, env={**os.environ, 'LOG_SAMPLE_RATE': '0'})
+    for line in server.stdout:
+        if line.strip() == 'ready':
+            return server, port
+    raise RuntimeError('benchmark server did not start')
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nvs {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    print(f"{'mode':<10} {'scenario':<8} {'p50 ms':>16} {'p99 ms':>16} {'req/s':>18}")
+    for mode, runs in results['results'].items():
+        for name, new in runs.items():
+            old = baseline['results'].get(mode, {}).get(name)
+            if not old:
+                continue
+            cells = []
+            for key in ('p50_ms', 'p99_ms', 'rps'):
+                a, b = old.get(key), new.get(key)
+                change = f'{(b - a) / a * 100:+.0f}%' if a and b is not None else ''
+                cells.append(f'{b} ({change})')
+            print(f"{mode:<10} {name:<8} {cells[0]:>16} {cells[1]:>16} {cells[2]:>18}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000, help='synthetic dataset size')
+    parser.add_argument('--requests', type=int, default=2000, help='requests per scenario')
+    parser.add_argument('--clients', type=int, default=4, help='concurrent HTTP clients')
+    parser.add_argument('--mode', choices=['inprocess', 'http', 'both'], default='both')
+    parser.add_argument('--scenarios', default='predict,batch,stats,static')
+    parser.add_argument('--out', default=None, help='write results JSON here')
+    parser.add_argument('--compare', default=None, help='baseline results JSON')
+    args = parser.parse_args()
+
+    from benchmarks.synth import write_synthetic_csv
+
+    names = args.scenarios.split(',')
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'rows': args.rows,
+            'requests': args.requests,
+            'clients': args.clients,
+            'batch_size': BATCH_SIZE,
+        },
+        'results': {},
+    }
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_synthetic_csv(os.path.join(data_dir, 'placement.csv'), args.rows)
+
+        if args.mode in ('inprocess', 'both'):
+            os.environ.setdefault('LOG_SAMPLE_RATE', '0')
+            from predictor.app import create_app
+
+            app = create_app(MODEL, static_dir=FRONTEND, dataset_dir=data_dir)
+            app.extensions['predictor'].warm_up()
+            make = scenarios()
+            results['results']['inprocess'] = {
+                name: run_inprocess(app, make[name], args.requests) for name in names}
+
+        if args.mode in ('http', 'both'):
+            server, port = start_server(data_dir)
+            try:
+                make = scenarios()
+                results['results']['http'] = {
+                    name: run_http(port, make[name], args.requests, args.clients, server.pid) for name in names}
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+    print(f"\n{'mode':<10} {'scenario':<8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>9} {'RSS MB':>7} {'errors':>6}")
+    for mode, runs in results['results'].items():
+        for name, r in runs.items():
+            print(f"{mode:<10} {name:<8} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} "
+                  f"{r['rps']:>9} {r['rss_mb']:>7} {r['errors']:>6}")
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results saved to {args.out}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
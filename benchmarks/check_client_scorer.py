@@ -0,0 +1,97 @@
+"""Check that in-browser scoring matches the server.
+
+    python benchmarks/check_client_scorer.py [--n 2000] [--tolerance 1e-9]
+
+Pulls the coefficients from GET /api/model and the server's answers from
+POST /api/predict (Flask test client, backend/model.pkl), then runs the
+scoreWithModel() function from frontend/script.js and
+placement_frontend/index.html under node on the same students. Exits
+non-zero if any prediction differs or a probability is off by more than
+--tolerance. Needs `node` on PATH.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, ROOT)
+
+MODEL = os.path.join(ROOT, 'backend', 'model.pkl')
+PAGES = [
+    os.path.join(ROOT, 'frontend', 'script.js'),
+    os.path.join(ROOT, 'placement_frontend', 'index.html'),
+]
+
+
+def extract_function(path, name='scoreWithModel'):
+    """Source of a top-level-style `function name(...) {...}` block."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    match = re.search(rf'^([ \t]*)function {name}\(.*?^\1}}$', source, re.S | re.M)
+    if match is None:
+        raise SystemExit(f'❌ {name}() not found in {path}')
+    return match.group(0)
+
+
+def students(n, seed=0):
+    rng = random.Random(seed)
+    points = [[round(rng.uniform(0, 10), 2), rng.randint(50, 200)] for _ in range(n)]
+    # Extremes of the input range and the neighbourhood of the decision boundary
+    points += [[0, 50], [10, 200], [0, 200], [10, 50]]
+    points += [[round(6.0 + i / 100, 2), 120] for i in range(40)]
+    return points
+
+
+def run_node(function_source, model, points):
+    program = (f'{function_source}\n'
+               f'const model = {json.dumps(model)};\n'
+               f'const points = {json.dumps(points)};\n'
+               'console.log(JSON.stringify(points.map(([c, i]) => scoreWithModel(model, c, i))));\n')
+    out = subprocess.run(['node'], input=program, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--n', type=int, default=2000, help='random students to compare')
+    parser.add_argument('--tolerance', type=float, default=1e-9, help='max probability difference')
+    args = parser.parse_args()
+
+    if shutil.which('node') is None:
+        raise SystemExit('❌ node is not installed')
+
+    os.environ.setdefault('LOG_SAMPLE_RATE', '0')
+    from predictor.app import create_app
+
+    client = create_app(MODEL, dataset_dir=None).test_client()
+    response = client.get('/api/model')
+    if response.status_code != 200:
+        raise SystemExit(f'❌ /api/model returned {response.status_code}')
+    model = response.get_json()
+
+    points = students(args.n)
+    server = [client.post('/api/predict?compact=1', json={'cgpa': c, 'iq': i}).get_json() for c, i in points]
+
+    failed = False
+    for page in PAGES:
+        browser = run_node(extract_function(page), model, points)
+        worst, mismatches = 0.0, 0
+        for s, b in zip(server, browser):
+            mismatches += s['prediction'] != b['prediction']
+            worst = max(worst, abs(s['probability'] - b['probability']))
+        ok = mismatches == 0 and worst <= args.tolerance
+        failed |= not ok
+        print(f"{'✅' if ok else '❌'} {os.path.relpath(page, ROOT)}: {len(points)} students, "
+              f"{mismatches} label mismatches, max |Δp| = {worst:.3g}")
+
+    print(f"Model version {model['version']}, threshold {model['threshold']}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
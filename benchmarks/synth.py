@@ -0,0 +1,45 @@
+"""Synthetic placement.csv-shaped data for benchmarks.
+
+    python benchmarks/synth.py out.csv --rows 1000000
+
+Rows look like the real export: an unnamed index column, cgpa (one
+decimal), iq and a 0/1 placement label that mostly follows CGPA.
+"""
+import argparse
+
+import numpy as np
+
+HEADER = ',cgpa,iq,placement\n'
+
+
+def synthetic_rows(n, seed=0):
+    """Return (cgpa, iq, placement) arrays for n students."""
+    rng = np.random.default_rng(seed)
+    cgpa = np.clip(np.round(rng.normal(6.0, 1.2, n), 1), 0, 10)
+    iq = np.clip(np.round(rng.normal(122, 40, n)), 50, 200)
+    logit = 2.8 * (cgpa - 6.0) - 0.003 * (iq - 122) + rng.normal(0, 0.5, n)
+    placement = (logit > 0).astype(np.int8)
+    return cgpa, iq, placement
+
+
+def write_synthetic_csv(path, rows, seed=0, chunk_rows=1000000):
+    """Write `rows` synthetic students to path, a chunk at a time."""
+    with open(path, 'w') as f:
+        f.write(HEADER)
+        for i, start in enumerate(range(0, rows, chunk_rows)):
+            n = min(chunk_rows, rows - start)
+            cgpa, iq, placement = synthetic_rows(n, seed + i)
+            index = np.arange(start, start + n)
+            np.savetxt(f, np.column_stack([index, cgpa, iq, placement]),
+                       fmt=['%d', '%.1f', '%.1f', '%d'], delimiter=',')
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write a synthetic placement dataset')
+    parser.add_argument('out')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_synthetic_csv(args.out, args.rows, args.seed)
+    print(f"✅ Wrote {args.rows} rows to {args.out}")
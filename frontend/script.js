@@ -1,7 +1,21 @@
+// How often the cached model coefficients are revalidated against the server
+const MODEL_TTL_MS = 60 * 1000;
+
+// Same logistic regression the server runs, using the coefficients from
+// /api/model (the scaler is already folded into coef and intercept)
+function scoreWithModel(model, cgpa, iq) {
+    const z = cgpa * model.coef[0] + iq * model.coef[1] + model.intercept;
+    const p = 1 / (1 + Math.exp(-z));
+    const prediction = p > model.threshold ? 1 : 0;
+    return { prediction: prediction, probability: prediction ? p : 1 - p };
+}
+
 class PlacementPredictor {
     constructor() {
         this.API_BASE = 'http://localhost:5001/api';
         this.predictionsHistory = [];
+        this.clientModel = this.readCachedModel();
+        this.modelCheckedAt = 0;
         this.init();
     }
     
@@ -9,6 +23,7 @@ class PlacementPredictor {
         this.cacheElements();
         this.setupEventListeners();
         this.checkBackend();
+        this.refreshModel();
         this.loadSampleData();
         this.initChart();
         this.loadStats();
@@ -86,6 +101,44 @@ class PlacementPredictor {
         }
     }
     
+    readCachedModel() {
+        try {
+            const model = JSON.parse(localStorage.getItem('placementModel'));
+            return model && model.format === 'placement-client-model' ? model : null;
+        } catch (error) {
+            return null;
+        }
+    }
+    
+    async refreshModel() {
+        // no-cache revalidates with the ETag, so an unchanged model is a 304
+        try {
+            const response = await fetch(`${this.API_BASE}/model`, { cache: 'no-cache' });
+            this.modelCheckedAt = Date.now();
+            if (response.ok) {
+                this.clientModel = await response.json();
+                localStorage.setItem('placementModel', JSON.stringify(this.clientModel));
+            } else {
+                // Demo mode: no real model, let the server answer
+                this.clientModel = null;
+                localStorage.removeItem('placementModel');
+            }
+        } catch (error) {
+            // Offline: keep whatever coefficients we already have
+        }
+    }
+    
+    async predictInBrowser(cgpa, iq) {
+        // Only touches the network when the coefficients are due a version check
+        if (Date.now() - this.modelCheckedAt > MODEL_TTL_MS) {
+            await this.refreshModel();
+        }
+        if (!this.clientModel) {
+            return null;
+        }
+        return { ...scoreWithModel(this.clientModel, cgpa, iq), cgpa: cgpa, iq: iq };
+    }
+    
     async loadStats() {
         try {
             const response = await fetch(`${this.API_BASE}/stats`);
@@ -199,20 +252,22 @@ class PlacementPredictor {
         this.predictBtn.innerHTML = '<i class="emoji">⏳</i> Predicting...';
         
         try {
-            const response = await fetch(`${this.API_BASE}/predict`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ cgpa, iq })
-            });
-            
-            let result;
-            if (response.ok) {
-                result = await response.json();
-            } else {
-                // Fallback to local prediction
-                result = this.getLocalPrediction(cgpa, iq);
+            let result = await this.predictInBrowser(cgpa, iq);
+            if (!result) {
+                const response = await fetch(`${this.API_BASE}/predict`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({ cgpa, iq })
+                });
+                
+                if (response.ok) {
+                    result = await response.json();
+                } else {
+                    // Fallback to local prediction
+                    result = this.getLocalPrediction(cgpa, iq);
+                }
             }
             
             this.displayResult(result);
@@ -230,7 +285,7 @@ class PlacementPredictor {
     }
     
     getLocalPrediction(cgpa, iq) {
-        // Smart prediction based on typical patterns
+        // Rough guess for when neither the server nor its coefficients are reachable
         let score = 0;
         
         // CGPA contributes 60%
@@ -0,0 +1 @@
+"""Shared code for the Placement Predictor Flask apps."""
@@ -0,0 +1,179 @@
+"""Flask app factory shared by run.py, app.py, placement_app.py and backend/app.py.
+
+    from predictor.app import create_app
+    app = create_app('backend/model.pkl', static_dir='frontend')
+
+Each entry point only differs in where its model, frontend and dataset
+live and whether the API is under /api. The PredictionService behind the
+routes is kept in app.extensions['predictor'].
+"""
+import time
+
+from flask import Flask, Response, abort, g, jsonify, request
+
+from predictor import codec
+from predictor.assets import AssetStore, serve
+from predictor.batch import BatchError, parse_batch, score_batch, score_batch_columns
+from predictor.loader import model_version
+from predictor.logs import log_error, log_prediction, setup_logging
+from predictor.metrics import (CONTENT_TYPE, REGISTRY, record_prediction, record_request,
+                               record_stages, register_service)
+from predictor.registry import admin_allowed
+from predictor.responses import prediction_payload, wants_compact
+from predictor.service import MODEL_PATH, SAMPLE_DATA, PredictionService
+from predictor.surface import SurfaceError, render as render_surface
+
+
+def create_app(model_path=MODEL_PATH, static_dir=None, api_prefix='/api',
+               dataset_dir='.', cors=False, extra_status=None):
+    """Build the Flask app.
+
+    static_dir: serve index.html and assets from here (precompressed and
+    fingerprinted, see predictor.assets), else a JSON banner at '/'.
+    dataset_dir: where to look for the placement CSV for /stats, None for
+    demo stats only.
+    """
+    app = Flask(__name__, static_folder=None)
+    if cors:
+        from flask_cors import CORS
+        CORS(app)
+
+    setup_logging()
+    service = PredictionService(model_path, dataset_dir).load()
+    app.extensions['predictor'] = service
+    register_service(service)
+
+    @app.before_request
+    def start_timer():
+        g.started = time.perf_counter()
+
+    @app.after_request
+    def count_request(response):
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        record_request(route, request.method, response.status_code, time.perf_counter() - g.started)
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+    if static_dir is not None:
+        assets = AssetStore(static_dir)
+
+        @app.route('/')
+        @app.route('/<path:path>')
+        def static_file(path=''):
+            response = serve(assets, path, request, Response)
+            if response is None:
+                abort(404)
+            return response
+    else:
+        @app.route('/')
+        def index_page():
+            return jsonify({"message": "Placement Predictor API", "status": "active"})
+
+    @app.route(f'{api_prefix}/predict', methods=['POST'])
+    def predict():
+        route = request.url_rule.rule
+        try:
+            t0 = time.perf_counter()
+            cgpa, iq = codec.parse_student(request.get_data())
+            t1 = time.perf_counter()
+            prediction, probability, model_type, model = service.predict(cgpa, iq)
+            t2 = time.perf_counter()
+            payload = prediction_payload(cgpa, iq, prediction, probability, model_type,
+                                         model_version(model), compact=wants_compact(request.args))
+            response = Response(codec.dumps(payload), mimetype='application/json')
+            record_stages(route, parse=t1 - t0, inference=t2 - t1, serialize=time.perf_counter() - t2)
+            record_prediction(model_type)
+            log_prediction(cgpa, iq, prediction, probability, model_type)
+            return response
+        except Exception as e:
+            log_error("Prediction error: %s", e)
+            return jsonify({'error': str(e)}), 400
+
+    @app.route(f'{api_prefix}/predict/batch', methods=['POST'])
+    def predict_batch():
+        model = service.models.model
+        if model is None:
+            return jsonify({'error': 'Model not loaded'}), 503
+        t0 = time.perf_counter()
+        try:
+            X = parse_batch(request)
+        except BatchError as e:
+            return jsonify({'error': str(e)}), e.status
+        t1 = time.perf_counter()
+        if wants_compact(request.args):
+            payload = {'count': len(X), **score_batch_columns(model, X, service.monitor)}
+        else:
+            payload = {'success': True, 'count': len(X), 'results': score_batch(model, X, service.monitor)}
+        payload['model_version'] = model_version(model)
+        t2 = time.perf_counter()
+        response = Response(codec.dumps(payload), mimetype='application/json')
+        record_stages(request.url_rule.rule, parse=t1 - t0, inference=t2 - t1,
+                      serialize=time.perf_counter() - t2)
+        record_prediction('real', count=len(X), kind='batch')
+        return response
+
+    @app.route(f'{api_prefix}/status', methods=['GET'])
+    def api_status():
+        return jsonify({**service.status(), **(extra_status or {})})
+
+    @app.route(f'{api_prefix}/admin/reload', methods=['POST'])
+    def admin_reload():
+        # Loads in a background thread; ?wait=1 blocks until the swap is done
+        if not admin_allowed(request):
+            return jsonify({'error': 'Forbidden'}), 403
+        wait = request.args.get('wait') == '1'
+        service.models.reload(wait=wait)
+        return jsonify({'success': True, **service.models.status()}), 200 if wait else 202
+
+    @app.route(f'{api_prefix}/stats', methods=['GET'])
+    def stats():
+        # Aggregates are kept in memory and refreshed only when the CSV changes
+        payload, etag = service.stats_snapshot()
+        response = jsonify(payload)
+        if etag is None:
+            return response
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    @app.route(f'{api_prefix}/model', methods=['GET'])
+    def client_model():
+        # Coefficients for scoring in the browser; revalidated by version
+        payload, etag = service.client_model()
+        if payload is None:
+            return jsonify({'error': 'Model not loaded'}), 503
+        response = jsonify(payload)
+        if etag is not None:
+            response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    @app.route(f'{api_prefix}/surface', methods=['GET'])
+    def surface():
+        # P(placed) over a CGPA x IQ grid, cached per (model version, grid)
+        try:
+            body, content_type, headers, etag = render_surface(service, request.args)
+        except SurfaceError as e:
+            return jsonify({'error': str(e)}), e.status
+        response = Response(body, content_type=content_type, headers=headers)
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    @app.route(f'{api_prefix}/drift', methods=['GET'])
+    def drift():
+        # Live feature / probability sketches against the training profile
+        report = service.drift_report()
+        if report is None:
+            return jsonify({'error': 'Drift monitoring is off (DRIFT_MONITOR=0)'}), 404
+        return Response(codec.dumps(report), mimetype='application/json')
+
+    @app.route(f'{api_prefix}/sample-data', methods=['GET'])
+    def sample_data():
+        # Sample data for frontend display
+        return jsonify(SAMPLE_DATA)
+
+    return app
@@ -0,0 +1,195 @@
+"""Model artifact format: plain arrays and JSON, no pickle.
+
+    python -m predictor.artifact backend/model.pkl   # writes backend/model.artifact
+
+model.pkl is loaded with pickle.load, which runs whatever code the file
+contains, needs the exact scikit-learn version that wrote it and imports
+all of sklearn. A .artifact file holds only data:
+
+    magic      8 bytes   b'PLCMODEL'
+    version    uint32    FORMAT_VERSION
+    length     uint32    header length in bytes
+    checksum   32 bytes  sha256 of everything after this preamble
+    header     JSON      features, classes, threshold, metadata and, for
+                         every array, its dtype / shape / offset
+    arrays     raw little-endian data, each aligned to 64 bytes
+
+The arrays are the logistic weights and intercept on scaled features and
+the scaler's mean and scale, which are folded together at load time.
+Loading checks the magic, version and checksum and takes tens of
+microseconds. mmap=True maps the file instead of reading it, so a much
+larger model would only page in what it touches.
+"""
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+from predictor.scorer import FEATURES, CompiledScorer, fold_scaler, scorer_path_for, source_hash
+
+MAGIC = b'PLCMODEL'
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct('<8sII32s')
+ALIGN = 64
+
+
+class ArtifactError(ValueError):
+    """Raised for files that aren't a valid, intact model artifact."""
+
+
+def artifact_path_for(model_path):
+    """backend/model.pkl (or model.scorer.json) -> backend/model.artifact"""
+    if model_path.endswith('.scorer.json'):
+        return model_path[:-len('.scorer.json')] + '.artifact'
+    return os.path.splitext(model_path)[0] + '.artifact'
+
+
+def _pad(n):
+    return -n % ALIGN
+
+
+def write_artifact(path, coef, intercept, mean, scale, threshold=0.5, classes=(0, 1),
+                   features=FEATURES, meta=None):
+    """Write a logistic regression (on (x - mean) / scale) as an artifact."""
+    arrays = {
+        'coef': np.asarray(coef, dtype='<f8').reshape(-1),
+        'intercept': np.asarray(intercept, dtype='<f8').reshape(-1),
+        'scaler_mean': np.asarray(mean, dtype='<f8').reshape(-1),
+        'scaler_scale': np.asarray(scale, dtype='<f8').reshape(-1),
+    }
+    if not all(len(arrays[k]) == len(features) for k in ('coef', 'scaler_mean', 'scaler_scale')):
+        raise ArtifactError(f'Expected {len(features)} weights and scaler values')
+
+    layout, data, offset = {}, [], 0
+    for name, array in arrays.items():
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        raw = array.tobytes()
+        data.append(raw + b'\0' * _pad(len(raw)))
+        offset += len(raw) + _pad(len(raw))
+
+    header = json.dumps({
+        'kind': 'logistic_regression',
+        'features': list(features),
+        'classes': [int(c) for c in classes],
+        'threshold': float(threshold),
+        'arrays': layout,
+        'meta': dict(meta or {}),
+    }, sort_keys=True).encode('utf-8')
+    header += b' ' * _pad(PREAMBLE.size + len(header))
+    body = header + b''.join(data)
+    preamble = PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header), hashlib.sha256(body).digest())
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(preamble + body)
+    os.replace(tmp, path)
+    return path
+
+
+def read_artifact(path, mmap_file=False, verify=True):
+    """(header dict, {name: array}) from an artifact file."""
+    with open(path, 'rb') as f:
+        if mmap_file:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+    if len(buffer) < PREAMBLE.size:
+        raise ArtifactError(f'{path} is truncated')
+    magic, version, header_len, checksum = PREAMBLE.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ArtifactError(f'{path} is not a model artifact')
+    if version > FORMAT_VERSION:
+        raise ArtifactError(f'{path} uses artifact format {version}, this code reads up to {FORMAT_VERSION}')
+    body = memoryview(buffer)[PREAMBLE.size:]
+    if verify and hashlib.sha256(body).digest() != checksum:
+        raise ArtifactError(f'{path} failed its checksum (corrupt or modified)')
+
+    try:
+        header = json.loads(bytes(body[:header_len]))
+    except ValueError as e:
+        raise ArtifactError(f'{path} has an unreadable header: {e}')
+    data_start = PREAMBLE.size + header_len
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        count = math.prod(spec['shape'])
+        start = data_start + spec['offset']
+        if start + count * dtype.itemsize > len(buffer):
+            raise ArtifactError(f'{path} is truncated ({name})')
+        arrays[name] = np.frombuffer(buffer, dtype, count, start).reshape(spec['shape'])
+    return header, arrays
+
+
+def load_artifact(path, mmap_file=False, verify=True):
+    """Load an artifact as a CompiledScorer carrying `threshold` and `meta`."""
+    header, arrays = read_artifact(path, mmap_file, verify)
+    if header.get('kind') != 'logistic_regression':
+        raise ArtifactError(f"{path} holds an unsupported model kind {header.get('kind')!r}")
+    if header['features'] != FEATURES:
+        raise ArtifactError(f"{path} expects features {header['features']}, not {FEATURES}")
+    coef, intercept = fold_scaler(arrays['coef'].reshape(1, -1), arrays['intercept'],
+                                  arrays['scaler_mean'], arrays['scaler_scale'])
+    meta = dict(header['meta'])
+    meta['scaler'] = {'mean': arrays['scaler_mean'].tolist(), 'scale': arrays['scaler_scale'].tolist()}
+    model = CompiledScorer(coef, intercept, header['classes'], meta)
+    model.threshold = header['threshold']
+    return model
+
+
+def save_model(model, out_path, threshold=0.5, meta=None):
+    """Write a fitted (scaler +) binary LogisticRegression as an artifact."""
+    mean, scale = np.zeros(len(FEATURES)), np.ones(len(FEATURES))
+    if hasattr(model, 'steps'):
+        if len(model.steps) > 2:
+            raise ArtifactError('Only a scaler + logistic regression pipeline can be saved')
+        if len(model.steps) == 2:
+            scaler = model.steps[0][1]
+            mean = scaler.mean_ if scaler.with_mean else mean
+            scale = scaler.scale_ if scaler.with_std else scale
+        model = model.steps[-1][1]
+    if not hasattr(model, 'coef_') or np.shape(model.coef_) != (1, len(FEATURES)):
+        raise ArtifactError(f'Not a binary logistic model on {FEATURES}')
+    return write_artifact(out_path, model.coef_, model.intercept_, mean, scale, threshold,
+                          model.classes_, meta=meta)
+
+
+def convert(model_path, out_path=None, threshold=None):
+    """Write the artifact for a pickled model (or a compiled scorer JSON).
+
+    Unpickling is the one step that runs code from the file, so only
+    convert models you trust.
+    """
+    import pickle
+
+    from predictor.inference import THRESHOLD
+
+    out_path = out_path or artifact_path_for(model_path)
+    threshold = THRESHOLD if threshold is None else threshold
+    if model_path.endswith('.json'):
+        # Already folded: store the weights with an identity scaler
+        scorer = CompiledScorer.load(model_path)
+        n = len(FEATURES)
+        return write_artifact(out_path, scorer.coef_, scorer.intercept_, np.zeros(n), np.ones(n),
+                              threshold, scorer.classes_, meta=scorer.meta)
+
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+    meta = getattr(model, 'training_meta', None)
+    if meta is None and os.path.exists(scorer_path_for(model_path)):
+        # predictor.train keeps its metadata in the scorer JSON
+        meta = CompiledScorer.load(scorer_path_for(model_path)).meta
+    meta = {k: v for k, v in (meta or {}).items() if k != 'scaler'}
+    meta.setdefault('source', os.path.basename(model_path))
+    meta['source_sha256'] = source_hash(model_path)
+    return save_model(model, out_path, threshold, meta)
+
+
+if __name__ == '__main__':
+    src = sys.argv[1] if len(sys.argv) > 1 else 'backend/model.pkl'
+    dst = sys.argv[2] if len(sys.argv) > 2 else None
+    print(f"✅ Model artifact written to {convert(src, dst)}")
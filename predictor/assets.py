@@ -0,0 +1,136 @@
+"""Static frontend assets: precompressed, fingerprinted, conditionally served.
+
+At startup AssetStore reads every file under a frontend directory and
+keeps in memory:
+
+  * the raw bytes plus gzip and (if the `brotli` package is installed)
+    brotli encodings, used when smaller than the original
+  * a content hash, giving a fingerprinted alias (script.3f2a9c1e0b.js)
+    that is served with a one-year immutable Cache-Control
+  * HTML with references to sibling assets rewritten to those aliases
+
+Plain names are still served, with `no-cache` so browsers revalidate via
+ETag / Last-Modified and get a 304 when nothing changed. Filenames are
+looked up with surrounding whitespace stripped, so `index.html   ` on disk
+is served as /index.html.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+MIN_COMPRESS = 256  # bytes; smaller files go out as-is
+COMPRESSIBLE = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+HASH_LENGTH = 10
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Asset:
+    def __init__(self, name, data, mtime):
+        self.name = name
+        self.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self.content_type = self.mimetype + ('; charset=utf-8' if self.mimetype.startswith('text/') else '')
+        self.mtime = int(mtime)
+        self.encode(data)
+
+    def encode(self, data):
+        self.digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        self.encodings = {'identity': data}
+        if len(data) >= MIN_COMPRESS and self.mimetype.startswith(COMPRESSIBLE):
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < len(data):
+                self.encodings['gzip'] = gz
+            if brotli is not None:
+                br = brotli.compress(data, quality=11)
+                if len(br) < len(data):
+                    self.encodings['br'] = br
+
+    @property
+    def fingerprinted(self):
+        base, ext = os.path.splitext(self.name)
+        return f'{base}.{self.digest}{ext}'
+
+    def choose(self, accept_encoding):
+        """Best (encoding, body) for an Accept-Encoding header."""
+        offered = {part.split(';')[0].strip() for part in (accept_encoding or '').lower().split(',')}
+        for encoding in ('br', 'gzip'):
+            if encoding in self.encodings and encoding in offered:
+                return encoding, self.encodings[encoding]
+        return 'identity', self.encodings['identity']
+
+    def etag(self, encoding):
+        return self.digest if encoding == 'identity' else f'{self.digest}-{encoding}'
+
+
+class AssetStore:
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.assets = {}   # URL path (no leading slash) -> Asset
+        self.aliases = {}  # fingerprinted path -> plain path
+        self.build()
+
+    def build(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                rel = os.path.relpath(path, self.root).replace(os.sep, '/')
+                name = '/'.join(part.strip() for part in rel.split('/'))
+                with open(path, 'rb') as f:
+                    self.assets[name] = Asset(name, f.read(), os.path.getmtime(path))
+
+        # Point HTML at the fingerprinted names so they can be cached forever
+        for asset in self.assets.values():
+            if asset.name.endswith('.html'):
+                asset.encode(self._rewrite(asset))
+        self.aliases = {asset.fingerprinted: asset.name for asset in self.assets.values()}
+
+    def _rewrite(self, page):
+        html = page.encodings['identity'].decode('utf-8')
+        directory = os.path.dirname(page.name)
+
+        def replace(match):
+            target = os.path.normpath(os.path.join(directory, match.group(2))).replace(os.sep, '/')
+            asset = self.assets.get(target)
+            if asset is None or asset is page or asset.name.endswith('.html'):
+                return match.group(0)
+            fingerprinted = os.path.join(os.path.dirname(match.group(2)), os.path.basename(asset.fingerprinted))
+            return f'{match.group(1)}"{fingerprinted}"'
+
+        return re.sub(r'((?:src|href)=)"([^":?#]+)"', replace, html).encode('utf-8')
+
+    def lookup(self, path):
+        """(Asset, immutable) for a URL path, or (None, False)."""
+        path = path.lstrip('/') or 'index.html'
+        if path in self.aliases:
+            return self.assets[self.aliases[path]], True
+        return self.assets.get(path), False
+
+    def stats(self):
+        return {
+            name: {k: len(v) for k, v in asset.encodings.items()}
+            for name, asset in sorted(self.assets.items())
+        }
+
+
+def serve(store, path, request, response_class):
+    """Flask/werkzeug response for an asset, honouring If-None-Match / If-Modified-Since."""
+    asset, immutable = store.lookup(path)
+    if asset is None:
+        return None
+    encoding, body = asset.choose(request.headers.get('Accept-Encoding'))
+    response = response_class(body, content_type=asset.content_type)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    if len(asset.encodings) > 1:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(asset.etag(encoding))
+    response.last_modified = asset.mtime
+    response.headers['Cache-Control'] = IMMUTABLE if immutable else REVALIDATE
+    return response.make_conditional(request)
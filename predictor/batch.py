@@ -0,0 +1,165 @@
+"""Batch prediction: parse many (cgpa, iq) records and score them in one call."""
+import csv
+import io
+import math
+import os
+
+import numpy as np
+
+from predictor import codec
+from predictor.inference import predict_many
+
+# Largest number of records accepted by one /api/predict/batch request
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 10000))
+
+CSV_TYPES = ('text/csv', 'application/csv')
+NDJSON_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonlines')
+
+
+class BatchError(ValueError):
+    """Raised when a batch request can't be turned into a feature matrix."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _check_size(n, max_size):
+    if n == 0:
+        raise BatchError('Batch is empty')
+    if n > max_size:
+        raise BatchError(f'Batch too large: {n} records (max {max_size})', status=413)
+
+
+def records_to_matrix(records, max_size=MAX_BATCH_SIZE):
+    """Turn a list of {'cgpa', 'iq'} dicts (or [cgpa, iq] pairs) into an (n, 2) matrix.
+
+    Every value must already be a JSON number; see predictor.codec.
+    """
+    if not isinstance(records, list):
+        raise BatchError('Expected a JSON array of records')
+    _check_size(len(records), max_size)
+    X = _fast_matrix(records)
+    if X is not None:
+        return X
+    # Slow path: find the first bad record and say what's wrong with it
+    X = np.empty((len(records), 2), dtype=np.float64)
+    for i, record in enumerate(records):
+        try:
+            X[i] = codec.student(record)
+        except codec.ValidationError as e:
+            raise BatchError(f'Invalid record {i}: {e}')
+    return X
+
+
+def _fast_matrix(records):
+    """The whole batch in one np.array call, or None if any record is off-schema."""
+    try:
+        pairs = [(r['cgpa'], r['iq']) if type(r) is dict else r for r in records]
+        if {type(v) for pair in pairs for v in pair} - {int, float}:
+            return None
+        X = np.array(pairs, dtype=np.float64)
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return None
+    if X.shape != (len(records), 2) or not np.isfinite(X).all():
+        return None
+    return X
+
+
+def csv_to_matrix(text, max_size=MAX_BATCH_SIZE):
+    """Read cgpa/iq columns from CSV text; other columns (index, placement) are ignored."""
+    reader = csv.reader(io.StringIO(text))
+    header = [h.strip().lower() for h in next(reader, [])]
+    if 'cgpa' not in header or 'iq' not in header:
+        raise BatchError('CSV must have cgpa and iq columns')
+    ci, ii = header.index('cgpa'), header.index('iq')
+
+    rows = []
+    for line in reader:
+        if not line:
+            continue
+        if len(rows) == max_size:
+            raise BatchError(f'Batch too large (max {max_size} records)', status=413)
+        try:
+            cgpa, iq = float(line[ci]), float(line[ii])
+        except (IndexError, ValueError) as e:
+            raise BatchError(f'Invalid CSV row {reader.line_num}: {e}')
+        # float() accepts nan, inf and 1e999; the JSON paths reject them
+        if not (math.isfinite(cgpa) and math.isfinite(iq)):
+            raise BatchError(f'Invalid CSV row {reader.line_num}: cgpa and iq must be finite')
+        rows.append((cgpa, iq))
+    _check_size(len(rows), max_size)
+    return np.array(rows, dtype=np.float64)
+
+
+def ndjson_to_matrix(text, max_size=MAX_BATCH_SIZE):
+    """Read one JSON record per line."""
+    records = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if len(records) == max_size:
+            raise BatchError(f'Batch too large (max {max_size} records)', status=413)
+        try:
+            records.append(codec.loads(line))
+        except codec.DecodeError as e:
+            raise BatchError(f'Invalid NDJSON line: {e}')
+    return records_to_matrix(records, max_size)
+
+
+def parse_batch(request, max_size=MAX_BATCH_SIZE):
+    """Build the feature matrix for a Flask batch request.
+
+    Accepts a JSON array (or {"records": [...]}), a CSV or NDJSON body,
+    or a multipart upload in the 'file' field. Row order is preserved.
+    """
+    upload = request.files.get('file')
+    if upload is not None:
+        try:
+            text = upload.read().decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise BatchError(f'Uploaded file must be UTF-8 text (invalid byte at offset {e.start})')
+        name = (upload.filename or '').lower()
+        if name.endswith(('.ndjson', '.jsonl')) or upload.mimetype in NDJSON_TYPES:
+            return ndjson_to_matrix(text, max_size)
+        return csv_to_matrix(text, max_size)
+
+    return parse_batch_body(request.get_data(), request.mimetype, max_size)
+
+
+def parse_batch_body(body, mimetype, max_size=MAX_BATCH_SIZE):
+    """Build the feature matrix from raw request bytes and their mimetype."""
+    if mimetype in CSV_TYPES:
+        return csv_to_matrix(body.decode('utf-8', 'replace'), max_size)
+    if mimetype in NDJSON_TYPES:
+        return ndjson_to_matrix(body.decode('utf-8', 'replace'), max_size)
+
+    try:
+        data = codec.loads(body)
+    except codec.DecodeError:
+        raise BatchError('Request body must be JSON, CSV or NDJSON')
+    if isinstance(data, dict):
+        data = data.get('records')
+    return records_to_matrix(data, max_size)
+
+
+def _score(model, X, monitor):
+    predictions, probabilities = predict_many(model, X)
+    if monitor is not None:
+        monitor.record_many(X, np.where(predictions == 1, probabilities, 1.0 - probabilities))
+    return predictions, probabilities
+
+
+def score_batch(model, X, monitor=None):
+    """Score every row of X with a single predict_proba call."""
+    predictions, probabilities = _score(model, X, monitor)
+    return [
+        {'prediction': p, 'probability': prob}
+        for p, prob in zip(predictions.tolist(), probabilities.tolist())
+    ]
+
+
+def score_batch_columns(model, X, monitor=None):
+    """Like score_batch, as two parallel lists (the compact response)."""
+    predictions, probabilities = _score(model, X, monitor)
+    return {'predictions': predictions.tolist(), 'probabilities': probabilities.tolist()}
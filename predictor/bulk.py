@@ -0,0 +1,257 @@
+"""Offline bulk scoring of placement.csv-shaped files.
+
+    python -m predictor.bulk roster.csv scored.csv [--workers 4] [--resume]
+    python -m predictor.bulk roster.csv scored.parquet
+
+The input is split into byte ranges of whole lines (--chunk-mb each) that
+a process pool parses and scores, with the model loaded once per worker.
+Results are written in input order: CSV as a single file, Parquet (needs
+pyarrow) as a directory of numbered part files. Progress is checkpointed
+to <output>.progress.json after every chunk, so --resume picks up an
+interrupted run where it stopped.
+
+Output columns are cgpa, iq, prediction and probability (of the predicted
+label, as in /api/predict). A placement column in the input is ignored.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from predictor.dataset import FEATURES, last_line_end, read_header
+from predictor.inference import predict_many, threshold_for
+from predictor.loader import load_model, model_version
+
+CHUNK_MB = 8
+REPORT_EVERY = 5.0  # seconds between progress lines
+OUTPUT_COLUMNS = FEATURES + ['prediction', 'probability']
+READ_DTYPES = {'cgpa': 'float64', 'iq': 'float64'}
+
+# Set in each worker by _init_worker
+_model = None
+_threshold = None
+
+
+def split_ranges(path, chunk_bytes):
+    """Byte ranges [(start, end), ...] of whole data lines, about chunk_bytes each."""
+    ranges = []
+    with open(path, 'rb') as f:
+        read_header(f)
+        start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        while start < size:
+            end = size
+            if start + chunk_bytes < size:
+                # A line longer than chunk_bytes just makes this chunk run to the end
+                end = last_line_end(f, start, start + chunk_bytes)
+                end = size if end == start else end
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _init_worker(model_path, threshold):
+    global _model, _threshold
+    _model = load_model(model_path)
+    _threshold = threshold
+
+
+def score_range(job):
+    """Parse and score one byte range. Returns (rows, CSV bytes or None)."""
+    from predictor.dataset import iter_chunks
+    import pandas as pd
+
+    path, start, end, part_path = job
+    frames = list(iter_chunks(path, sys.maxsize, start=start, end=end, columns=FEATURES, dtypes=READ_DTYPES))
+    frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    labels, probabilities = predict_many(_model, frame.to_numpy(), _threshold)
+
+    if part_path is None:
+        # Same text as DataFrame.to_csv, in about 60% of the time
+        columns = (frame['cgpa'].tolist(), frame['iq'].tolist(), labels.tolist(), probabilities.tolist())
+        rows = [f'{cgpa!r},{iq!r},{label},{p!r}\n' for cgpa, iq, label, p in zip(*columns)]
+        return len(rows), ''.join(rows).encode('utf-8')
+
+    # Parquet parts are independent files, so workers write them directly
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    frame['prediction'] = labels
+    frame['probability'] = probabilities
+    tmp = part_path + '.tmp'
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), tmp)
+    os.replace(tmp, part_path)
+    return len(frame), None
+
+
+class CsvOutput:
+    def __init__(self, path, progress, resume=False):
+        if not resume:
+            self.f = open(path, 'wb')
+            self.f.write((','.join(OUTPUT_COLUMNS) + '\n').encode('utf-8'))
+        else:
+            # Drop anything written after the last checkpoint
+            self.f = open(path, 'r+b')
+            self.f.truncate(progress['output_bytes'])
+            self.f.seek(progress['output_bytes'])
+
+    def part_path(self, index):
+        return None
+
+    def write(self, data):
+        self.f.write(data)
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def position(self):
+        return self.f.tell()
+
+    def close(self):
+        self.f.close()
+
+
+class ParquetOutput:
+    def __init__(self, path, progress, resume=False):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        # Keep the parts of checkpointed chunks; later ones may be partial or stale
+        keep = progress['chunks_done'] if resume else 0
+        for old in glob.glob(os.path.join(path, 'part-*.parquet*')):
+            index = os.path.basename(old)[len('part-'):].split('.')[0]
+            if not index.isdigit() or int(index) >= keep or old.endswith('.tmp'):
+                os.remove(old)
+
+    def part_path(self, index):
+        return os.path.join(self.path, f'part-{index:05d}.parquet')
+
+    def write(self, data):
+        pass
+
+    def position(self):
+        return None
+
+    def close(self):
+        pass
+
+
+def progress_path_for(out_path):
+    return out_path.rstrip('/\\') + '.progress.json'
+
+
+def save_progress(path, progress):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(progress, f, indent=2)
+    os.replace(tmp, path)
+
+
+def load_progress(path, expected):
+    """Checkpoint from an earlier run, after checking it was for the same job."""
+    try:
+        with open(path) as f:
+            progress = json.load(f)
+    except FileNotFoundError:
+        sys.exit(f'❌ No checkpoint at {path}; run without --resume')
+    for key, value in expected.items():
+        if progress.get(key) != value:
+            sys.exit(f'❌ {key} changed since the interrupted run '
+                     f'({progress.get(key)!r} -> {value!r}); run without --resume')
+    return progress
+
+
+def bulk_score(in_path, out_path, model_path, workers, chunk_bytes, fmt, threshold=None, resume=False):
+    """Score in_path into out_path; returns (rows, seconds)."""
+    if fmt == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            sys.exit('❌ Parquet output needs pyarrow: pip install pyarrow')
+
+    ranges = split_ranges(in_path, chunk_bytes)
+    stat = os.stat(in_path)
+    model = load_model(model_path)
+    threshold = threshold_for(model) if threshold is None else threshold
+    job = {
+        'input': os.path.abspath(in_path),
+        'input_size': stat.st_size,
+        'input_mtime': stat.st_mtime,
+        'chunk_bytes': chunk_bytes,
+        'format': fmt,
+        'model_version': model_version(model),
+        'threshold': threshold,
+    }
+    progress_path = progress_path_for(out_path)
+    progress = {**job, 'chunks_done': 0, 'rows_done': 0, 'output_bytes': None}
+    if resume:
+        progress = load_progress(progress_path, job)
+        print(f"🔄 Resuming at chunk {progress['chunks_done']}/{len(ranges)} "
+              f"({progress['rows_done']:,} rows already scored)")
+
+    Output = ParquetOutput if fmt == 'parquet' else CsvOutput
+    output = Output(out_path, progress, resume)
+    done = progress['chunks_done']
+    jobs = [(in_path, start, end, output.part_path(i)) for i, (start, end) in enumerate(ranges)][done:]
+    total_bytes = sum(end - start for start, end in ranges)
+    bytes_done = sum(end - start for start, end in ranges[:done])
+
+    pool = None
+    if workers > 1:
+        pool = Pool(workers, initializer=_init_worker, initargs=(model_path, threshold))
+        results = pool.imap(score_range, jobs)
+    else:
+        _init_worker(model_path, threshold)
+        results = map(score_range, jobs)
+
+    started = last_report = time.perf_counter()
+    rows_this_run = 0
+    try:
+        for i, (rows, data) in enumerate(results, start=done):
+            output.write(data)
+            rows_this_run += rows
+            bytes_done += ranges[i][1] - ranges[i][0]
+            progress.update(chunks_done=i + 1, rows_done=progress['rows_done'] + rows,
+                            output_bytes=output.position())
+            save_progress(progress_path, progress)
+            now = time.perf_counter()
+            if now - last_report >= REPORT_EVERY:
+                last_report = now
+                print(f"⏱️ {progress['rows_done']:,} rows ({bytes_done / total_bytes:.0%}), "
+                      f"{rows_this_run / (now - started):,.0f} rows/s")
+    finally:
+        if pool is not None:
+            pool.terminate()
+        output.close()
+
+    os.remove(progress_path)
+    return rows_this_run, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score a placement CSV offline with a process pool')
+    parser.add_argument('input', help='CSV with cgpa and iq columns')
+    parser.add_argument('output', help='.csv file, or .parquet directory of part files')
+    parser.add_argument('--model', default='backend/model.pkl')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-mb', type=float, default=CHUNK_MB, help='input bytes per task')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default=None,
+                        help='default: from the output extension')
+    parser.add_argument('--threshold', type=float, default=None, help="default: the model's own")
+    parser.add_argument('--resume', action='store_true', help='continue an interrupted run')
+    args = parser.parse_args()
+
+    fmt = args.format or ('parquet' if args.output.rstrip('/\\').endswith('.parquet') else 'csv')
+    try:
+        rows, seconds = bulk_score(args.input, args.output, args.model, max(1, args.workers),
+                                   int(args.chunk_mb * 1024 * 1024), fmt, args.threshold, args.resume)
+    except KeyboardInterrupt:
+        sys.exit(f"\n⏸️ Interrupted; rerun with --resume to continue from {progress_path_for(args.output)}")
+    rate = rows / seconds if seconds else 0
+    print(f"✅ Scored {rows:,} rows in {seconds:.1f}s ({rate:,.0f} rows/s, {args.workers} workers) "
+          f"-> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
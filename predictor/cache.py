@@ -0,0 +1,87 @@
+"""Bounded LRU/TTL cache for single predictions.
+
+The inputs live on a small grid (CGPA 0-10 in 0.1 steps, integer IQ), and
+the same values come in over and over, so we remember P(placed) per grid
+point. Keys include the model version, and the whole cache is dropped as
+soon as a different model version asks for a prediction.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_SIZE = int(os.environ.get('PREDICT_CACHE_SIZE', 20000))
+CACHE_TTL = float(os.environ.get('PREDICT_CACHE_TTL', 0))  # seconds, 0 = never expire
+
+
+def quantize(cgpa, iq):
+    """Grid key for (cgpa, iq), or None if the point is off the 0.1 x 1 grid."""
+    c = round(cgpa * 10)
+    i = round(iq)
+    if c / 10 != cgpa or i != iq:
+        return None
+    return c, i
+
+
+class PredictionCache:
+    def __init__(self, maxsize=CACHE_SIZE, ttl=CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, version):
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires = entry
+            if expires and expires < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, version, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+            expires = time.monotonic() + self.ttl if self.ttl else 0
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def _reset(self, version):
+        self._data.clear()
+        self.version = version
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'model_version': self.version,
+            }
@@ -0,0 +1,75 @@
+"""JSON encoding/decoding and input validation for the predict API.
+
+orjson is used when it is installed (JSON_CODEC=auto, the default) and
+the standard library otherwise; JSON_CODEC=json forces the fallback.
+Either way dumps() returns bytes ready to send.
+
+Predict input is checked against a tiny schema before anything is
+coerced: an object with numeric, finite `cgpa` and `iq`. Strings,
+booleans, nulls and missing fields are rejected with a message naming the
+field, instead of failing somewhere inside float().
+"""
+import json
+import math
+import os
+
+CODEC = os.environ.get('JSON_CODEC', 'auto')
+
+
+class ValidationError(ValueError):
+    """Raised when a predict request doesn't match the input schema."""
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+try:
+    if CODEC == 'json':
+        raise ImportError
+    import orjson
+
+    NAME = 'orjson'
+    loads = orjson.loads
+    dumps = orjson.dumps
+    DecodeError = orjson.JSONDecodeError
+except ImportError:
+    NAME = 'json'
+    loads = json.loads
+    dumps = _stdlib_dumps
+    DecodeError = ValueError
+
+
+def _number(value, field):
+    # bool is an int subclass, but true/false isn't a CGPA
+    if type(value) not in (int, float):
+        if value is None:
+            raise ValidationError(f"'{field}' is required and must be a number")
+        raise ValidationError(f"'{field}' must be a number, got {type(value).__name__}")
+    try:
+        value = float(value)
+    except OverflowError:
+        value = math.inf
+    if not math.isfinite(value):
+        raise ValidationError(f"'{field}' must be finite")
+    return value
+
+
+def student(record):
+    """Validate one {'cgpa', 'iq'} record (or [cgpa, iq] pair); returns floats."""
+    if isinstance(record, dict):
+        return _number(record.get('cgpa'), 'cgpa'), _number(record.get('iq'), 'iq')
+    if isinstance(record, (list, tuple)) and len(record) == 2:
+        return _number(record[0], 'cgpa'), _number(record[1], 'iq')
+    raise ValidationError('Expected a JSON object with cgpa and iq')
+
+
+def parse_student(body):
+    """Decode and validate a single predict request body."""
+    try:
+        record = loads(body)
+    except DecodeError as e:
+        raise ValidationError(f'Invalid JSON: {e}')
+    if not isinstance(record, dict):
+        raise ValidationError('Expected a JSON object with cgpa and iq')
+    return student(record)
@@ -0,0 +1,108 @@
+"""Columnar binary cache of the dataset.
+
+Converts placement.csv into one .npy file per column (cgpa, iq, placement)
+plus a meta.json recording the size and mtime of the CSV it came from.
+Loading memory-maps the columns, so startup and the first /api/stats hit
+cost no CSV parsing. The cache is only used while the CSV is unchanged.
+
+    python -m predictor.columnar placement.csv
+"""
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from predictor.dataset import CHUNK_ROWS, COLUMNS, DTYPES, iter_chunks, last_line_end, read_header
+
+FORMAT_VERSION = 1
+META = 'meta.json'
+
+
+def cache_dir_for(csv_path):
+    """placement.csv -> placement.columns/"""
+    return os.path.splitext(csv_path)[0] + '.columns'
+
+
+def signature(path):
+    """{size, mtime_ns} of a file; caches derived from it store this to detect changes."""
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def convert(csv_path, out_dir=None, chunksize=CHUNK_ROWS):
+    """Stream the CSV into per-column .npy files; returns the cache directory.
+
+    Only complete lines are converted; meta.json records the byte offset
+    where conversion stopped so readers can continue from there.
+    """
+    out_dir = out_dir or cache_dir_for(csv_path)
+    os.makedirs(out_dir, exist_ok=True)
+    meta_path = os.path.join(out_dir, META)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)  # invalidate while we rewrite
+
+    source = signature(csv_path)
+    with open(csv_path, 'rb') as f:
+        read_header(f)
+        end = last_line_end(f, f.tell(), source['size'])
+
+    # Append raw column bytes first; the row count is only known at the end
+    raw = {c: open(os.path.join(out_dir, f'{c}.raw'), 'wb') for c in COLUMNS}
+    rows = 0
+    try:
+        for chunk in iter_chunks(csv_path, chunksize, end=end):
+            for c in COLUMNS:
+                raw[c].write(np.ascontiguousarray(chunk[c].to_numpy()).tobytes())
+            rows += len(chunk)
+    finally:
+        for f in raw.values():
+            f.close()
+
+    for c in COLUMNS:
+        raw_path = os.path.join(out_dir, f'{c}.raw')
+        tmp_path = os.path.join(out_dir, f'{c}.npy.tmp')
+        header = {'descr': np.lib.format.dtype_to_descr(np.dtype(DTYPES[c])),
+                  'fortran_order': False, 'shape': (rows,)}
+        with open(tmp_path, 'wb') as out, open(raw_path, 'rb') as src:
+            np.lib.format.write_array_header_1_0(out, header)
+            shutil.copyfileobj(src, out)
+        os.replace(tmp_path, os.path.join(out_dir, f'{c}.npy'))
+        os.remove(raw_path)
+
+    meta = {'format_version': FORMAT_VERSION, 'rows': rows, 'offset': end,
+            'source': os.path.basename(csv_path), **source}
+    with open(meta_path + '.tmp', 'w') as f:
+        json.dump(meta, f)
+    os.replace(meta_path + '.tmp', meta_path)
+    return out_dir
+
+
+def load_columns(csv_path, cache_dir=None):
+    """Memory-mapped columns for csv_path, or None if there is no fresh cache.
+
+    Returns (columns dict, meta). The cache counts as fresh only when the
+    CSV still has the size and mtime it had when it was converted.
+    """
+    cache_dir = cache_dir or cache_dir_for(csv_path)
+    try:
+        with open(os.path.join(cache_dir, META)) as f:
+            meta = json.load(f)
+        if meta.get('format_version') != FORMAT_VERSION:
+            return None
+        source = signature(csv_path)
+        if source['size'] != meta['size'] or source['mtime_ns'] != meta['mtime_ns']:
+            return None
+        columns = {c: np.load(os.path.join(cache_dir, f'{c}.npy'), mmap_mode='r') for c in COLUMNS}
+    except (OSError, ValueError, KeyError):
+        return None
+    if any(len(col) != meta['rows'] for col in columns.values()):
+        return None
+    return columns, meta
+
+
+if __name__ == '__main__':
+    src = sys.argv[1] if len(sys.argv) > 1 else 'placement.csv'
+    out = convert(src)
+    print(f"✅ Columnar cache written to {out}")
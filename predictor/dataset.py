@@ -0,0 +1,106 @@
+"""Locating and reading the placement dataset.
+
+Large exports are read in fixed-size chunks with compact dtypes, so peak
+memory depends on the chunk size rather than the file size. The same
+iterator feeds /api/stats and training.
+"""
+import io
+import os
+
+FEATURES = ['cgpa', 'iq']
+TARGET = 'placement'
+COLUMNS = FEATURES + [TARGET]
+DTYPES = {'cgpa': 'float32', 'iq': 'float32', 'placement': 'int8'}
+
+CHUNK_ROWS = int(os.environ.get('INGEST_CHUNK_ROWS', 100000))
+SCAN_BLOCK = 65536
+
+# placement.csv is what the notebook exports; the repo ships a copy
+DATASET_NAMES = ('placement.csv', 'placement copy.csv')
+
+
+def find_dataset(base_dir='.'):
+    """Return the path of the first dataset found in base_dir, or None."""
+    for name in DATASET_NAMES:
+        path = os.path.join(base_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class _Window(io.RawIOBase):
+    """Read-only view of a binary file that stops at byte `end`."""
+
+    def __init__(self, f, end):
+        self.f = f
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        n = min(len(buf), self.end - self.f.tell())
+        if n <= 0:
+            return 0
+        data = self.f.read(n)
+        buf[:len(data)] = data
+        return len(data)
+
+
+def read_header(f):
+    """Column names from the first line of an open binary CSV file."""
+    f.seek(0)
+    return [name.strip() for name in f.readline().decode('utf-8').rstrip('\r\n').split(',')]
+
+
+def last_line_end(f, start, size):
+    """Offset just past the last newline in f[start:size], or start if none."""
+    pos = size
+    while pos > start:
+        block_start = max(start, pos - SCAN_BLOCK)
+        f.seek(block_start)
+        i = f.read(pos - block_start).rfind(b'\n')
+        if i >= 0:
+            return block_start + i + 1
+        pos = block_start
+    return start
+
+
+def iter_chunks(path, chunksize=CHUNK_ROWS, start=None, end=None, columns=COLUMNS, dtypes=DTYPES):
+    """Yield DataFrames of up to `chunksize` rows with cgpa, iq, placement.
+
+    Columns use float32/float32/int8 and anything else (such as the unnamed
+    index column the notebook strips with iloc[:,1:]) is dropped while
+    parsing. `start`/`end` restrict reading to a byte range of data lines,
+    which lets callers pick up only rows appended since their last read.
+    Pass `columns` to read a subset, e.g. FEATURES for unlabelled rosters,
+    and `dtypes` to override the compact types.
+    """
+    import pandas as pd
+
+    with open(path, 'rb') as f:
+        names = read_header(f)
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+        if start is not None:
+            f.seek(start)
+        if end is None:
+            end = os.fstat(f.fileno()).st_size
+        reader = pd.read_csv(
+            io.BufferedReader(_Window(f, end)),
+            header=None,
+            names=names,
+            usecols=columns,
+            dtype={c: dtypes[c] for c in columns},
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            yield chunk[columns]
+
+
+def load_frame(path, chunksize=CHUNK_ROWS):
+    """Read the whole dataset (compact dtypes, index column dropped)."""
+    import pandas as pd
+
+    return pd.concat(iter_chunks(path, chunksize), ignore_index=True)
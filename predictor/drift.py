@@ -0,0 +1,337 @@
+"""Streaming drift and data-quality monitoring of predict traffic.
+
+Every prediction the model serves (/api/predict and /api/predict/batch) is
+recorded as (cgpa, iq, P(placed)) and summarised in constant memory:
+
+    count, mean, variance, min, max   merged with Chan's parallel update
+    fixed-bin histogram               RANGES, plus an under- and overflow bin
+    quantile sketch                   log-spaced buckets, 1% relative error
+
+GET /api/drift compares them with the reference profile written next to
+the model at training time (backend/model.profile.json): the population
+stability index (PSI) of each histogram, the mean shift in reference
+standard deviations and the share of values outside RANGES, with the
+quantiles side by side.
+
+Recording is a list append into one of DRIFT_SHARDS buffers, picked per
+thread, under that shard's lock, which is uncontended while there are no
+more request threads than shards. Every FLUSH_EVERY values a buffer is
+folded into its shard's sketches with numpy; a report flushes and merges
+all shards. Each process keeps its own monitor (as
+with predictor.metrics), and it starts over whenever a model is swapped in.
+
+    python -m predictor.drift backend/model.pkl placement.csv   # profile for an existing model
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+ENABLED = os.environ.get('DRIFT_MONITOR', '1') == '1'
+SHARDS = int(os.environ.get('DRIFT_SHARDS', 8))
+FLUSH_EVERY = 2048  # predictions buffered per shard between folds
+MIN_COUNT = int(os.environ.get('DRIFT_MIN_COUNT', 100))  # live values before alerting
+PSI_ALERT = float(os.environ.get('DRIFT_PSI_ALERT', 0.2))
+RANGE_ALERT = 0.01  # share of values outside RANGES, above the reference's
+
+PROFILE_FORMAT = 'placement-drift-profile'
+PROFILE_FORMAT_VERSION = 1
+STREAMS = ('cgpa', 'iq', 'probability')
+RANGES = {'cgpa': (0.0, 10.0, 10), 'iq': (0.0, 300.0, 15), 'probability': (0.0, 1.0, 10)}  # (low, high, bins)
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+# Quantile sketch: magnitudes in (GAMMA^(i-1), GAMMA^i] share bucket i
+SKETCH_ACCURACY = 0.01
+GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+SKETCH_MIN, SKETCH_MAX = 1e-6, 1e6  # smaller magnitudes count as 0, larger are clamped
+SKETCH_OFFSET = math.ceil(math.log(SKETCH_MIN) / LOG_GAMMA)
+SKETCH_BUCKETS = math.ceil(math.log(SKETCH_MAX) / LOG_GAMMA) - SKETCH_OFFSET + 1
+
+
+def profile_path_for(model_path):
+    """backend/model.pkl -> backend/model.profile.json"""
+    return os.path.splitext(model_path)[0] + '.profile.json'
+
+
+def _bucket_value(bucket):
+    return 2 * GAMMA ** (bucket + SKETCH_OFFSET) / (GAMMA + 1)
+
+
+class Sketch:
+    """Constant-memory summary of one stream; fold() arrays in, merge() shards."""
+
+    def __init__(self, name):
+        self.low, self.high, bins = RANGES[name]
+        self.edges = np.linspace(self.low, self.high, bins + 1)
+        self.count = 0
+        self.mean = self.m2 = 0.0
+        self.min, self.max = math.inf, -math.inf
+        self.invalid = 0  # NaN / inf
+        self.histogram = np.zeros(bins + 2, dtype=np.int64)
+        self.buckets = np.zeros(2 * SKETCH_BUCKETS, dtype=np.int64)  # positive, then negative
+        self.zero = 0
+
+    def fold(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        finite = np.isfinite(values)
+        if not finite.all():
+            self.invalid += int(len(values) - finite.sum())
+            values = values[finite]
+        if len(values) == 0:
+            return
+        mean = float(values.mean())
+        self._combine(len(values), mean, float(np.square(values - mean).sum()),
+                      float(values.min()), float(values.max()))
+
+        index = np.searchsorted(self.edges, values, side='right')
+        index[values == self.high] = len(self.edges) - 1  # the top edge belongs to the last bin
+        self.histogram += np.bincount(index, minlength=len(self.histogram))
+
+        magnitude = np.abs(values)
+        small = magnitude < SKETCH_MIN
+        self.zero += int(small.sum())
+        buckets = np.ceil(np.log(np.clip(magnitude, SKETCH_MIN, SKETCH_MAX)) / LOG_GAMMA).astype(np.int64)
+        buckets = np.clip(buckets - SKETCH_OFFSET, 0, SKETCH_BUCKETS - 1) + SKETCH_BUCKETS * (values < 0)
+        self.buckets += np.bincount(buckets[~small], minlength=len(self.buckets))
+
+    def _combine(self, n, mean, m2, low, high):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    def merge(self, other):
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        self.invalid += other.invalid
+        self.histogram += other.histogram
+        self.buckets += other.buckets
+        self.zero += other.zero
+        return self
+
+    def quantiles(self, qs=QUANTILES):
+        """Approximate quantiles (within SKETCH_ACCURACY relative error)."""
+        if not self.count:
+            return {}
+        # Buckets in value order: most negative first, then zero, then positive
+        cumulative = np.cumsum(np.concatenate([self.buckets[SKETCH_BUCKETS:][::-1], [self.zero],
+                                               self.buckets[:SKETCH_BUCKETS]]))
+        out = {}
+        for q in qs:
+            i = int(np.searchsorted(cumulative, q * (self.count - 1), side='right'))
+            if i < SKETCH_BUCKETS:
+                value = -_bucket_value(SKETCH_BUCKETS - 1 - i)
+            elif i == SKETCH_BUCKETS:
+                value = 0.0
+            else:
+                value = _bucket_value(i - SKETCH_BUCKETS - 1)
+            out[f'p{round(q * 100):02d}'] = min(max(value, self.min), self.max)
+        return out
+
+    def summary(self):
+        count = self.count
+        return {
+            'count': count,
+            'invalid': self.invalid,
+            'mean': self.mean if count else None,
+            'std': math.sqrt(self.m2 / count) if count else None,
+            'min': self.min if count else None,
+            'max': self.max if count else None,
+            'quantiles': self.quantiles(),
+            'out_of_range': (int(self.histogram[0]) + int(self.histogram[-1])) / count if count else 0.0,
+            'range': [self.low, self.high],
+            'histogram': self.histogram.tolist(),
+        }
+
+
+class _Shard:
+    def __init__(self):
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.sketches = [Sketch(name) for name in STREAMS]
+
+    # Callers hold self.lock for both
+
+    def fold(self, rows):
+        """Fold an (n, 3) array of (cgpa, iq, P(placed))."""
+        for sketch, column in zip(self.sketches, rows.T):
+            sketch.fold(column)
+
+    def flush(self):
+        if self.buffer:
+            self.fold(np.array(self.buffer, dtype=np.float64).reshape(-1, len(STREAMS)))
+            self.buffer = []
+
+
+def psi(live, reference, smoothing=0.5):
+    """Population stability index between two histograms of counts.
+
+    Every bin gets `smoothing` extra counts, so bins empty on one side (the
+    reference is often a few hundred rows) don't dominate the index.
+    """
+    live = np.asarray(live, dtype=np.float64) + smoothing
+    reference = np.asarray(reference, dtype=np.float64) + smoothing
+    p, q = live / live.sum(), reference / reference.sum()
+    return float(np.sum((p - q) * np.log(p / q)))
+
+
+class DriftMonitor:
+    def __init__(self, reference=None, shards=SHARDS):
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+        self.shard_count = max(1, shards)
+        self.reset(reference)
+
+    def reset(self, reference=None):
+        """Start over against a new reference profile (None: summaries only)."""
+        self.reference = reference
+        self.started_at = time.time()
+        self._shards = [_Shard() for _ in range(self.shard_count)]
+
+    def _shard(self):
+        try:
+            index = self._local.shard
+        except AttributeError:
+            index = self._local.shard = next(self._next_shard) % self.shard_count
+        return self._shards[index]
+
+    def record(self, cgpa, iq, probability):
+        """Note one prediction (probability = P(placed)); a list append on most calls."""
+        shard = self._shard()
+        with shard.lock:
+            shard.buffer += (cgpa, iq, probability)  # flat, which numpy converts faster than tuples
+            if len(shard.buffer) >= FLUSH_EVERY * len(STREAMS):
+                shard.flush()
+
+    def record_many(self, X, probabilities):
+        """Note a scored (n, 2) batch and its P(placed) values."""
+        rows = np.column_stack([np.asarray(X, dtype=np.float64), probabilities])
+        shard = self._shard()
+        with shard.lock:
+            shard.fold(rows)
+
+    def sketches(self):
+        """Every shard flushed and merged into one Sketch per stream."""
+        merged = [Sketch(name) for name in STREAMS]
+        for shard in self._shards:
+            with shard.lock:
+                shard.flush()
+                for total, sketch in zip(merged, shard.sketches):
+                    total.merge(sketch)
+        return dict(zip(STREAMS, merged))
+
+    def report(self, model_version=None):
+        """Live summaries, the reference and how far apart they are."""
+        sketches = self.sketches()
+        reference = self.reference
+        streams, alerts = {}, []
+        for name, sketch in sketches.items():
+            live = sketch.summary()
+            entry = {'live': live}
+            ref = reference['streams'].get(name) if reference is not None else None
+            if ref is not None and ref['count']:
+                entry['reference'] = ref
+                entry['psi'] = round(psi(live['histogram'], ref['histogram']), 4) if live['count'] else None
+                entry['mean_shift'] = ((live['mean'] - ref['mean']) / ref['std']
+                                       if live['count'] and ref['std'] else None)
+                if live['count'] >= MIN_COUNT:
+                    if entry['psi'] >= PSI_ALERT:
+                        alerts.append(f"{name}: distribution shifted (PSI {entry['psi']:.2f})")
+                    if live['out_of_range'] > ref['out_of_range'] + RANGE_ALERT:
+                        low, high = live['range']
+                        alerts.append(f"{name}: {live['out_of_range']:.1%} of values outside {low:g}-{high:g}")
+            if live['invalid']:
+                alerts.append(f"{name}: {live['invalid']} non-finite values")
+            streams[name] = entry
+
+        count = sketches['cgpa'].count
+        if reference is None:
+            status = 'no_reference'
+        elif count < MIN_COUNT:
+            status = 'warming_up'
+        else:
+            status = 'drift' if alerts else 'ok'
+        return {
+            'status': status,
+            'alerts': alerts,
+            'model_version': model_version,
+            'since': self.started_at,
+            'predictions': count,
+            'shards': self.shard_count,
+            'reference': reference['meta'] if reference is not None else None,
+            'thresholds': {'psi': PSI_ALERT, 'out_of_range': RANGE_ALERT, 'min_count': MIN_COUNT},
+            'streams': streams,
+        }
+
+
+def build_profile(model, chunks, meta=None):
+    """Reference profile of training data: chunks is an (n, 2) array or an iterable of them."""
+    if isinstance(chunks, np.ndarray):
+        chunks = [chunks]
+    shard = _Shard()
+    for X in chunks:
+        X = np.asarray(X, dtype=np.float64)
+        shard.fold(np.column_stack([X, model.predict_proba(X)[:, 1]]))
+    meta = {k: v for k, v in (meta or {}).items() if k in ('data', 'trained_at', 'version')}
+    return {
+        'format': PROFILE_FORMAT,
+        'format_version': PROFILE_FORMAT_VERSION,
+        'meta': {**meta, 'rows': shard.sketches[0].count},
+        'ranges': {name: list(RANGES[name]) for name in STREAMS},
+        'streams': {name: sketch.summary() for name, sketch in zip(STREAMS, shard.sketches)},
+    }
+
+
+def save_profile(profile, path):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def load_profile(path):
+    """Reference profile at path, or None if missing or written with other RANGES."""
+    try:
+        with open(path) as f:
+            profile = json.load(f)
+    except FileNotFoundError:
+        return None
+    if profile.get('format') != PROFILE_FORMAT or profile.get('format_version', 0) > PROFILE_FORMAT_VERSION:
+        print(f"⚠️ {path} is not a drift profile this version reads, drift alerts are off")
+        return None
+    if profile.get('ranges') != {name: list(RANGES[name]) for name in STREAMS}:
+        print(f"⚠️ {path} uses other histogram ranges; rebuild it with python -m predictor.drift")
+        return None
+    return profile
+
+
+def main(argv=None):
+    from predictor.dataset import CHUNK_ROWS, FEATURES, iter_chunks
+    from predictor.loader import load_model
+
+    parser = argparse.ArgumentParser(description='Write the drift reference profile for a trained model')
+    parser.add_argument('model', nargs='?', default='backend/model.pkl')
+    parser.add_argument('data', nargs='?', default='placement.csv', help='the CSV it was trained on')
+    parser.add_argument('--out', default=None, help='default: <model>.profile.json')
+    args = parser.parse_args(argv)
+
+    model = load_model(args.model)
+    chunks = (c.to_numpy() for c in iter_chunks(args.data, CHUNK_ROWS, columns=FEATURES,
+                                                dtypes={'cgpa': 'float64', 'iq': 'float64'}))
+    profile = build_profile(model, chunks, {'data': os.path.basename(args.data)})
+    path = save_profile(profile, args.out or profile_path_for(args.model))
+    print(f"✅ Drift profile of {profile['meta']['rows']} rows written to {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Model inference shared by every predict handler.
+
+One predict_proba pass gives both the label and its probability, so the
+handlers no longer call predict() and predict_proba() on the same input.
+"""
+import os
+
+import numpy as np
+
+from predictor.cache import quantize
+from predictor.loader import model_version
+
+# P(placed) above this is reported as "Placed". 0.5 matches model.predict().
+# When PREDICT_THRESHOLD is unset, a model artifact's own threshold wins.
+THRESHOLD_OVERRIDE = os.environ.get('PREDICT_THRESHOLD')
+THRESHOLD = float(THRESHOLD_OVERRIDE or 0.5)
+
+
+def threshold_for(model):
+    if THRESHOLD_OVERRIDE is not None:
+        return THRESHOLD
+    return getattr(model, 'threshold', THRESHOLD)
+
+
+def predict_many(model, X, threshold=None):
+    """Score an (n, 2) matrix; returns (labels, probability of each label)."""
+    if threshold is None:
+        threshold = threshold_for(model)
+    proba = model.predict_proba(X)
+    labels = (proba[:, 1] > threshold).astype(np.int64)
+    return labels, proba[np.arange(len(proba)), labels]
+
+
+def placed_probability(model, cgpa, iq, cache=None, table=None):
+    """P(placed) for one student.
+
+    Served from the lookup table or cache when the point is on the grid
+    and they were built for this model version, else from the model.
+    """
+    version = model_version(model)
+    if table is not None and table.version == version:
+        p = table.lookup(cgpa, iq)
+        if p is not None:
+            return p
+    key = quantize(cgpa, iq) if cache is not None else None
+    if key is not None:
+        p = cache.get(key, version)
+        if p is not None:
+            return p
+    p = float(model.predict_proba(np.array([[cgpa, iq]], dtype=np.float64))[0, 1])
+    if key is not None:
+        cache.put(key, version, p)
+    return p
+
+
+def predict_one(model, cgpa, iq, threshold=None, cache=None, table=None):
+    """Score a single student; returns (prediction, probability) as Python scalars."""
+    if threshold is None:
+        threshold = threshold_for(model)
+    p = placed_probability(model, cgpa, iq, cache, table)
+    prediction = 1 if p > threshold else 0
+    return prediction, p if prediction else 1.0 - p
@@ -0,0 +1,69 @@
+"""Model loading shared by the Flask apps."""
+import os
+import pickle
+
+from predictor.artifact import artifact_path_for, load_artifact
+from predictor.scorer import CompiledScorer, scorer_path_for, source_hash
+
+# MODEL_ALLOW_PICKLE=0 refuses to unpickle model.pkl when no artifact exists
+ALLOW_PICKLE = os.environ.get('MODEL_ALLOW_PICKLE', '1') == '1'
+
+
+def file_version(path):
+    """Short content hash of an artifact, used as the model version."""
+    return source_hash(path)[:12]
+
+
+def model_version(model):
+    return getattr(model, 'version', None)
+
+
+def _matches(path, candidate, meta):
+    """True if candidate was exported from the pickle at path as it is now.
+
+    Exports record the pickle's sha256; older ones without it fall back to
+    comparing mtimes, which a git checkout leaves nearly equal.
+    """
+    if not os.path.exists(path):
+        return True
+    expected = meta.get('source_sha256')
+    if expected is not None:
+        return expected == source_hash(path)
+    return os.path.getmtime(candidate) >= os.path.getmtime(path)
+
+
+def load_model(path):
+    """Load the model served from `path` (e.g. backend/model.pkl).
+
+    Looks for, in order, a model.artifact (checksummed arrays, see
+    predictor.artifact), a compiled scorer (model.scorer.json) and finally
+    the pickle itself. The first two are only used while they were exported
+    from the pickle as it is now, and neither imports sklearn. The returned model carries
+    a `version` attribute (artifact hash). Raises FileNotFoundError when
+    none of the files exists.
+    """
+    artifact_path = artifact_path_for(path)
+    if os.path.exists(artifact_path):
+        model = load_artifact(artifact_path)
+        if _matches(path, artifact_path, model.meta):
+            model.version = file_version(artifact_path)
+            return model
+
+    scorer_path = scorer_path_for(path)
+    if os.path.exists(scorer_path):
+        model = CompiledScorer.load(scorer_path)
+        if _matches(path, scorer_path, model.meta):
+            model.version = file_version(scorer_path)
+            return model
+
+    if not ALLOW_PICKLE and os.path.exists(path):
+        raise PermissionError(f"Refusing to unpickle {path} (MODEL_ALLOW_PICKLE=0). "
+                              f"Convert it with: python -m predictor.artifact {path}")
+    with open(path, 'rb') as f:
+        model = pickle.load(f)
+    if not hasattr(model, 'steps'):
+        # The notebook pickled the bare classifier without its StandardScaler
+        print(f"⚠️ {path} has no scaler, predictions on raw CGPA/IQ will be off. "
+              "Retrain with: python -m predictor.train")
+    model.version = file_version(path)
+    return model
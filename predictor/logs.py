@@ -0,0 +1,49 @@
+"""Request logging off the hot path.
+
+Records go through a QueueHandler to a listener thread that does the
+actual stdout writes, so a request never waits on terminal or pipe I/O.
+Per-prediction lines are sampled: LOG_SAMPLE_RATE (default 0.01) of them
+are logged, 1 logs every request and 0 none. Errors are always logged.
+"""
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+
+SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', 0.01))
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+logger = logging.getLogger('predictor')
+_listener_pid = None
+
+
+def setup_logging():
+    """Attach the queue handler once per process (again after a fork)."""
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return logger
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+    logging.handlers.QueueListener(log_queue, stream).start()
+    _listener_pid = os.getpid()
+    return logger
+
+
+def sampled():
+    return SAMPLE_RATE >= 1 or (SAMPLE_RATE > 0 and random.random() < SAMPLE_RATE)
+
+
+def log_prediction(cgpa, iq, prediction, probability, model_type):
+    if sampled():
+        logger.info("📊 Prediction: CGPA=%s, IQ=%s -> %s (p=%.3f, %s)",
+                    cgpa, iq, prediction, probability, model_type)
+
+
+def log_error(message, *args):
+    logger.warning("❌ " + message, *args)
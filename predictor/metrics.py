@@ -0,0 +1,185 @@
+"""Request metrics in Prometheus text format.
+
+A small in-process registry of counters and histograms, rendered for
+GET /metrics without needing prometheus_client. Each process keeps its
+own numbers: behind serve.py every gunicorn worker reports separately.
+
+    placement_requests_total{route, method, status}
+    placement_request_duration_seconds{route}            whole request
+    placement_stage_duration_seconds{route, stage}       parse / inference / serialize
+    placement_predictions_total{path, kind}              model / demo, single / batch rows
+    placement_errors_total{route, status}                4xx / 5xx responses
+    placement_drift_psi{stream}                          PSI against the training profile
+"""
+import bisect
+import threading
+
+LATENCY_BUCKETS = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Histogram:
+    """Bucket counts: counts[i] holds values in (bounds[i-1], bounds[i]],
+    the last bucket everything above bounds[-1]."""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self):
+        running, out = 0, []
+        for n in self.counts:
+            running += n
+            out.append(running)
+        return out
+
+    def to_dict(self):
+        return {
+            'buckets': [{'le': b, 'count': n} for b, n in zip(self.bounds + ['+Inf'], self.counts)],
+            'count': self.total,
+            'avg': self.sum / self.total if self.total else 0.0,
+            'max': self.max,
+        }
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels) + '}'
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help = {}       # name -> (type, help)
+        self._counters = {}   # (name, labels) -> value
+        self._histograms = {}  # (name, labels) -> Histogram
+        self._gauges = {}     # name -> (help, callback returning [(labels, value)])
+
+    def counter(self, name, help_text):
+        self._help[name] = ('counter', help_text)
+
+    def histogram(self, name, help_text):
+        self._help[name] = ('histogram', help_text)
+
+    def gauge(self, name, help_text, callback):
+        """callback() -> [(labels dict, value), ...], read at render time."""
+        self._gauges[name] = (help_text, callback)
+
+    def inc(self, name, labels=None, value=1):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=None, buckets=LATENCY_BUCKETS):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram(buckets)
+            hist.observe(value)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(((k, h.bounds, h.cumulative(), h.sum, h.total)
+                                 for k, h in self._histograms.items()), key=lambda item: item[0])
+        lines = []
+        seen = set()
+
+        def header(name, kind, help_text):
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+
+        for (name, labels), value in counters:
+            header(name, 'counter', self._help.get(name, ('', name))[1])
+            lines.append(f'{name}{_labels(labels)} {_number(value)}')
+        for (name, labels), bounds, cumulative, total_sum, count in histograms:
+            header(name, 'histogram', self._help.get(name, ('', name))[1])
+            for bound, n in zip(bounds + [float('inf')], cumulative):
+                lines.append(f'{name}_bucket{_labels(labels + (("le", _number(bound)),))} {n}')
+            lines.append(f'{name}_sum{_labels(labels)} {_number(total_sum)}')
+            lines.append(f'{name}_count{_labels(labels)} {count}')
+        for name, (help_text, callback) in sorted(self._gauges.items()):
+            header(name, 'gauge', help_text)
+            for labels, value in callback():
+                lines.append(f'{name}{_labels(tuple(sorted(labels.items())))} {_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+REGISTRY.counter('placement_requests_total', 'HTTP requests by route, method and status.')
+REGISTRY.histogram('placement_request_duration_seconds', 'Time spent handling a request.')
+REGISTRY.histogram('placement_stage_duration_seconds', 'Predict handler time by stage (parse, inference, serialize).')
+REGISTRY.counter('placement_predictions_total', 'Scored rows by path (model or demo) and kind (single or batch).')
+REGISTRY.counter('placement_errors_total', 'Responses with a 4xx or 5xx status.')
+
+
+def record_request(route, method, status, seconds, registry=REGISTRY):
+    registry.inc('placement_requests_total', {'route': route, 'method': method, 'status': status})
+    registry.observe('placement_request_duration_seconds', seconds, {'route': route})
+    if status >= 400:
+        registry.inc('placement_errors_total', {'route': route, 'status': status})
+
+
+def record_stages(route, registry=REGISTRY, **stages):
+    for stage, seconds in stages.items():
+        registry.observe('placement_stage_duration_seconds', seconds, {'route': route, 'stage': stage})
+
+
+def record_prediction(model_type, registry=REGISTRY, count=1, kind='single'):
+    path = 'model' if model_type == 'real' else model_type
+    registry.inc('placement_predictions_total', {'path': path, 'kind': kind}, count)
+
+
+def register_service(service, registry=REGISTRY):
+    """Gauges read from a PredictionService at scrape time.
+
+    Gauges are keyed by name in the registry, so each call rebinds them to
+    the latest service: with several create_app() calls in one process,
+    the last app's service is the one reported.
+    """
+    def cache():
+        stats = service.cache.stats()
+        return [({'kind': k}, stats[k]) for k in ('hits', 'misses', 'evictions', 'size')]
+
+    def model_loaded():
+        return [({}, 1 if service.models.model is not None else 0)]
+
+    def queue_depth():
+        return [({}, service.batcher.stats()['queue_depth'])] if service.batcher is not None else []
+
+    def drift_psi():
+        report = service.drift_report()
+        if report is None:
+            return []
+        return [({'stream': name}, s['psi']) for name, s in report['streams'].items() if s.get('psi') is not None]
+
+    registry.gauge('placement_cache', 'Prediction cache counters and size.', cache)
+    registry.gauge('placement_model_loaded', '1 if a model is loaded, 0 in demo mode.', model_loaded)
+    registry.gauge('placement_microbatch_queue_depth', 'Single predictions waiting for a batch.', queue_depth)
+    registry.gauge('placement_drift_psi', 'Population stability index of live traffic vs the training data.',
+                   drift_psi)
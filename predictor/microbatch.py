@@ -0,0 +1,217 @@
+"""Micro-batching of single predictions.
+
+Requests that arrive within MICROBATCH_WAIT_MS of each other (or until
+MICROBATCH_MAX_SIZE are waiting) are stacked into one matrix and scored
+with a single vectorized predict_proba call; each caller gets its own row.
+
+MicroBatcher does this with a worker thread for the Flask apps (MICROBATCH=1),
+AsyncMicroBatcher on the event loop for asgi.py (ASYNC_MICROBATCH=1).
+"""
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from predictor.inference import predict_many
+from predictor.metrics import Histogram
+
+MAX_SIZE = int(os.environ.get('MICROBATCH_MAX_SIZE', 64))
+MAX_WAIT = float(os.environ.get('MICROBATCH_WAIT_MS', 2)) / 1000
+ENABLED = os.environ.get('MICROBATCH', '0') == '1'
+RESULT_TIMEOUT = 10  # seconds a caller waits for its batch before giving up
+
+WAIT_BUCKETS_MS = [0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100]
+
+
+class BatchMetrics:
+    """Batch sizes and the latency batching adds (enqueue to scoring start)."""
+
+    def __init__(self, max_size):
+        bounds, b = [], 1
+        while b < max_size:
+            bounds.append(b)
+            b *= 2
+        self.batch_sizes = Histogram(bounds + [max_size])
+        self.added_wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def observe(self, size, waits):
+        with self._lock:
+            self.batch_sizes.observe(size)
+            for wait in waits:
+                self.added_wait_ms.observe(wait * 1000)
+
+    def to_dict(self):
+        with self._lock:
+            sizes = self.batch_sizes.to_dict()
+            return {
+                'batches': sizes['count'],
+                'rows': round(self.batch_sizes.sum),
+                'avg_batch_size': sizes['avg'],
+                'batch_size_histogram': sizes['buckets'],
+                'added_latency_ms': self.added_wait_ms.to_dict(),
+                'errors': self.errors,
+            }
+
+
+class _Pending:
+    __slots__ = ('row', 'enqueued', 'done', 'result', 'error')
+
+    def __init__(self, cgpa, iq):
+        self.row = (cgpa, iq)
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """Thread-based micro-batcher for synchronous (Flask) handlers.
+
+    Callers block in predict() while a single worker thread drains the
+    queue: it waits for the first request, then keeps collecting until
+    max_size rows or max_wait after that first request, and scores them
+    together. `get_model` is called once per batch. The worker is started
+    lazily, and again in a forked child (gunicorn preload), since threads
+    don't survive fork.
+    """
+
+    def __init__(self, get_model, max_size=MAX_SIZE, max_wait=MAX_WAIT):
+        self.get_model = get_model
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.metrics = BatchMetrics(max_size)
+        self._queue = queue.Queue()
+        self._worker = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._worker is not None and self._pid == os.getpid():
+                return
+            if self._pid is not None:  # forked: the parent's queue and worker are gone
+                self._queue = queue.Queue()
+            self._pid = os.getpid()
+            self._worker = threading.Thread(target=self._run, name='microbatch', daemon=True)
+            self._worker.start()
+
+    def predict(self, cgpa, iq):
+        """Returns (prediction, probability, model) for one student."""
+        self._ensure_worker()
+        pending = _Pending(cgpa, iq)
+        self._queue.put(pending)
+        if not pending.done.wait(RESULT_TIMEOUT):
+            raise TimeoutError('Timed out waiting for the prediction batch')
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = batch[0].enqueued + self.max_wait
+        while len(batch) < self.max_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                if timeout > 0:
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())  # take what's already queued
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            self.metrics.observe(len(batch), [started - p.enqueued for p in batch])
+            model = self.get_model()
+            try:
+                X = np.array([p.row for p in batch], dtype=np.float64)
+                labels, proba = predict_many(model, X)
+                for p, label, prob in zip(batch, labels.tolist(), proba.tolist()):
+                    p.result = (label, prob, model)
+            except Exception as e:
+                self.metrics.errors += 1
+                for p in batch:
+                    p.error = e
+            for p in batch:
+                p.done.set()
+
+    def stats(self):
+        return {
+            'max_size': self.max_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'queue_depth': self._queue.qsize(),
+            **self.metrics.to_dict(),
+        }
+
+
+class AsyncMicroBatcher:
+    """asyncio micro-batcher; create it inside the running event loop.
+
+    `get_model` is called once per batch, so every row of a batch is
+    scored by the same model even across a hot reload. Scoring runs in
+    `executor` (the loop's default when None) to keep the loop free.
+    """
+
+    def __init__(self, get_model, max_size=MAX_SIZE, max_wait=MAX_WAIT, executor=None):
+        import asyncio  # only asgi.py needs it
+
+        self.get_model = get_model
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self._loop = asyncio.get_running_loop()
+        self._pending = []
+        self._timer = None
+        self.metrics = BatchMetrics(max_size)
+
+    async def predict(self, cgpa, iq):
+        """Returns (prediction, probability, model) for one student."""
+        future = self._loop.create_future()
+        self._pending.append((cgpa, iq, future, time.perf_counter()))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self._loop.create_task(self._score(batch))
+
+    async def _score(self, batch):
+        started = time.perf_counter()
+        self.metrics.observe(len(batch), [started - enqueued for *_, enqueued in batch])
+        model = self.get_model()
+        X = np.array([(cgpa, iq) for cgpa, iq, _, _ in batch], dtype=np.float64)
+        try:
+            labels, proba = await self._loop.run_in_executor(self.executor, predict_many, model, X)
+        except Exception as e:
+            self.metrics.errors += 1
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future, _), label, p in zip(batch, labels.tolist(), proba.tolist()):
+            if not future.done():  # the client may have gone away
+                future.set_result((label, p, model))
+
+    def stats(self):
+        return {
+            'max_size': self.max_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'queue_depth': len(self._pending),
+            **self.metrics.to_dict(),
+        }
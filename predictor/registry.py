@@ -0,0 +1,155 @@
+"""Hot model reload.
+
+ModelHolder owns the served model and its lookup table as one (model, table)
+tuple. A reload loads the new artifact in a background thread, checks it on
+a small canary set, and only then replaces the tuple. Rebinding a single
+attribute is atomic, so a request that reads `holder.current` once always
+gets a fully loaded, matching pair.
+
+Reloads are triggered by POST /api/admin/reload or, with MODEL_WATCH=1, by a
+thread polling the artifact mtimes every MODEL_WATCH_INTERVAL seconds.
+"""
+import hmac
+import math
+import os
+import threading
+import time
+
+from predictor.artifact import artifact_path_for
+from predictor.loader import load_model, model_version
+from predictor.scorer import scorer_path_for
+from predictor.table import maybe_load_table
+
+WATCH = os.environ.get('MODEL_WATCH', '0') == '1'
+WATCH_INTERVAL = float(os.environ.get('MODEL_WATCH_INTERVAL', 2))
+
+# Inputs every model must score sensibly before it is swapped in
+CANARY = [[7.5, 130.0], [5.2, 101.0], [9.0, 150.0], [3.0, 60.0], [0.0, 50.0], [10.0, 200.0]]
+
+
+class CanaryError(ValueError):
+    """Raised when a freshly loaded model fails the canary check."""
+
+
+def check_canary(model):
+    # One row at a time, like /api/predict (a batch call would also pull in scipy at startup)
+    for x in CANARY:
+        proba = model.predict_proba([x])
+        if getattr(proba, 'shape', None) != (1, 2):
+            raise CanaryError(f'predict_proba returned shape {getattr(proba, "shape", None)}')
+        row = proba[0].tolist()
+        if not all(math.isfinite(p) and 0.0 <= p <= 1.0 for p in row) or abs(sum(row) - 1.0) > 1e-6:
+            raise CanaryError(f'Invalid probabilities on canary input {x}: {row}')
+
+
+class ModelHolder:
+    def __init__(self, path, on_swap=None):
+        self.path = path
+        self.current = (None, None)  # (model, lookup table); replaced, never mutated
+        self._on_swap = on_swap
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        self._mtimes = None
+        self.reloads = 0
+        self.last_error = None
+        self.loaded_at = None
+
+    @property
+    def model(self):
+        return self.current[0]
+
+    def _artifact_mtimes(self):
+        mtimes = []
+        for path in (self.path, scorer_path_for(self.path), artifact_path_for(self.path)):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def load(self):
+        """Load, check and swap in the artifact at self.path (blocking).
+
+        Raises FileNotFoundError / CanaryError and keeps the old model on failure.
+        """
+        with self._reload_lock:
+            mtimes = self._artifact_mtimes()
+            model = load_model(self.path)
+            check_canary(model)
+            table = maybe_load_table(model, self.path)
+            previous = self.current[0]
+            self.current = (model, table)
+            self._mtimes = mtimes
+            self.loaded_at = time.time()
+            if previous is not None:
+                self.reloads += 1
+        if self._on_swap is not None:
+            self._on_swap(model)
+        return model
+
+    def _load_quietly(self):
+        try:
+            model = self.load()
+            self.last_error = None
+            print(f"🔄 Model reloaded: version {model_version(model)}")
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"⚠️ Model reload failed, keeping version {model_version(self.model)}: {e}")
+
+    def reload(self, wait=False):
+        """Reload off the request path; with wait=True block until done."""
+        thread = threading.Thread(target=self._load_quietly, name='model-reload', daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+        return thread
+
+    def start_watcher(self, interval=WATCH_INTERVAL):
+        """Poll the artifact files and reload when they change."""
+        if self._watcher is not None:
+            return self._watcher
+        if self._mtimes is None:
+            self._mtimes = self._artifact_mtimes()
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                # load() records the mtimes it saw before reading; after a
+                # failed load they stay stale, so the next poll retries
+                if self._artifact_mtimes() != self._mtimes:
+                    self._load_quietly()
+
+        self._watcher = threading.Thread(target=watch, name='model-watcher', daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def after_fork(self):
+        """Reset thread state in a freshly forked worker process."""
+        self._reload_lock = threading.Lock()
+        watching = self._watcher is not None
+        self._watcher = None
+        if watching:
+            self.start_watcher()
+
+    def status(self):
+        return {
+            'model_loaded': self.model is not None,
+            'model_version': model_version(self.model),
+            'reloads': self.reloads,
+            'last_reload_error': self.last_error,
+            'loaded_at': self.loaded_at,
+            'watching': self._watcher is not None,
+        }
+
+
+def admin_allowed(request):
+    """ADMIN_TOKEN (X-Admin-Token header) when set, otherwise localhost only.
+
+    Without a token, a reverse proxy on the same host makes every client
+    look like 127.0.0.1; set ADMIN_TOKEN whenever the app sits behind one.
+    """
+    token = os.environ.get('ADMIN_TOKEN')
+    if token:
+        given = request.headers.get('x-admin-token') or ''  # asgi.Request keeps names lowercase
+        return hmac.compare_digest(given.encode('utf-8'), token.encode('utf-8'))
+    return request.remote_addr in ('127.0.0.1', '::1')
@@ -0,0 +1,68 @@
+"""Prediction response pieces shared by the predict handlers."""
+import os
+import random
+
+# Leave out display-only fields (fun_message, message, echoed inputs, confidence)
+COMPACT = os.environ.get('COMPACT_RESPONSES', '0') == '1'
+
+PLACED_MESSAGES = [
+    "🎯 Placement hogya! Jaa, jee le apni zindagi! 🥳",
+    "🚀 Company ne pakad liya! Ab bas chutti! 🏖️",
+    "💰 Package mil gaya! Party time! 🍾",
+    "🏆 Selection ho gaya! Champion! 🏅",
+    "🎊 Congratulations! Ab trip plan kar! ✈️"
+]
+
+NOT_PLACED_MESSAGES = [
+    "😢 Nhi hoga placement! Lage reh! 📚",
+    "💔 Aaj nahi toh kal! Keep trying! 💪",
+    "📉 Thoda aur mehnat chahiye! 🤓",
+    "😅 Chill kar! Abhi time hai! 🕰️",
+    "🤔 CGPA improve kar, IQ badha! Next time pakka! ✨"
+]
+
+
+def demo_prediction(cgpa, iq):
+    """Rule-of-thumb (prediction, probability) used when no model is loaded."""
+    if cgpa > 7.0 and iq > 120:
+        return 1, 0.85
+    if cgpa > 6.5 and iq > 110:
+        return 1, 0.65
+    if cgpa > 6.0 and iq > 100:
+        return 1, 0.45
+    return 0, 0.25
+
+
+def fun_message(prediction):
+    return random.choice(PLACED_MESSAGES if prediction == 1 else NOT_PLACED_MESSAGES)
+
+
+def wants_compact(args):
+    """?compact=1 / ?compact=0 override COMPACT_RESPONSES per request."""
+    value = args.get('compact')
+    if value is None:
+        return COMPACT
+    return value not in ('0', 'false', '')
+
+
+def prediction_payload(cgpa, iq, prediction, probability, model_type, version, compact=False):
+    """The /api/predict response body."""
+    if compact:
+        return {
+            'prediction': int(prediction),
+            'probability': probability,
+            'model_type': model_type,
+            'model_version': version
+        }
+    return {
+        'success': True,
+        'prediction': int(prediction),
+        'probability': probability,
+        'message': 'Placed' if prediction == 1 else 'Not Placed',
+        'fun_message': fun_message(prediction),
+        'cgpa': cgpa,
+        'iq': iq,
+        'model_type': model_type,
+        'model_version': version,
+        'confidence': round(probability * 100)
+    }
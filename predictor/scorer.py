@@ -0,0 +1,199 @@
+"""Compiled scorer: logistic regression as a dot product and a sigmoid.
+
+The Flask apps only need coef_ and intercept_ from the trained model, so we
+export those to a small JSON file and score with NumPy at request time.
+This skips sklearn's input validation on every call and means the servers
+don't have to import sklearn at all. When the model is a scaler + logistic
+regression pipeline, the scaling is folded into the exported weights.
+
+Export a pickled model with:
+
+    python -m predictor.scorer backend/model.pkl
+"""
+import hashlib
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+FORMAT = 'placement-scorer'
+CLIENT_FORMAT = 'placement-client-model'
+FORMAT_VERSION = 1
+FEATURES = ['cgpa', 'iq']
+
+
+def scorer_path_for(model_path):
+    """backend/model.pkl -> backend/model.scorer.json"""
+    return os.path.splitext(model_path)[0] + '.scorer.json'
+
+
+def source_hash(path):
+    """sha256 of a file; exports record their pickle's as meta['source_sha256']."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _numpy_expit(z):
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+_expit = None
+
+
+def _get_expit():
+    # sklearn uses scipy.special.expit; using the same ufunc keeps batch
+    # results within a few ulps of the pipeline (about 1e-15, since the
+    # scaler is folded into coef/intercept), well inside the 1e-9 the
+    # tests allow. scipy is only imported on the first batch call, and
+    # plain NumPy is used when it isn't installed.
+    global _expit
+    if _expit is None:
+        try:
+            from scipy.special import expit
+            _expit = expit
+        except ImportError:
+            _expit = _numpy_expit
+    return _expit
+
+
+class CompiledScorer:
+    """Drop-in replacement for LogisticRegression.predict_proba on two features."""
+
+    def __init__(self, coef, intercept, classes=(0, 1), meta=None):
+        self.coef_ = np.asarray(coef, dtype=np.float64).reshape(1, -1)
+        self.intercept_ = np.asarray(intercept, dtype=np.float64).reshape(1)
+        self.classes_ = np.asarray(classes)
+        self.meta = dict(meta or {})
+        # Plain floats for the single-row path
+        self._w = [float(w) for w in self.coef_[0]]
+        self._b = float(self.intercept_[0])
+
+    def decision_function(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        return (X @ self.coef_.T + self.intercept_).reshape(-1)
+
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if X.shape[0] == 1:
+            # math.exp is the same libm call scipy's expit makes
+            z = sum(x * w for x, w in zip(X[0].tolist(), self._w)) + self._b
+            try:
+                p = 1.0 / (1.0 + math.exp(-z))
+            except OverflowError:
+                p = 0.0
+            return np.array([[1.0 - p, p]])
+        p = _get_expit()(self.decision_function(X))
+        return np.vstack([1 - p, p]).T
+
+    def predict(self, X):
+        return self.classes_[(self.decision_function(X) > 0).astype(np.int64)]
+
+    def to_dict(self):
+        return {
+            'format': FORMAT,
+            'format_version': FORMAT_VERSION,
+            'features': FEATURES,
+            'classes': self.classes_.tolist(),
+            'coef': self.coef_[0].tolist(),
+            'intercept': float(self.intercept_[0]),
+            'meta': self.meta,
+        }
+
+    def save(self, path):
+        # json writes floats with repr(), which round-trips exactly
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp, path)
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('format') != FORMAT:
+            raise ValueError(f"Not a compiled scorer: format={data.get('format')!r}")
+        if data.get('format_version', 0) > FORMAT_VERSION:
+            raise ValueError(f"Unsupported scorer version {data['format_version']}")
+        return cls(data['coef'], data['intercept'], data.get('classes', (0, 1)), data.get('meta'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_model(cls, model, meta=None):
+        """Compile a fitted binary LogisticRegression.
+
+        A StandardScaler -> LogisticRegression pipeline is accepted too; the
+        scaling is folded into the weights so inference costs nothing extra.
+        """
+        meta = dict(meta or {})
+        scaler = None
+        if hasattr(model, 'steps'):
+            if len(model.steps) > 2:
+                raise ValueError('Only a scaler + classifier pipeline can be compiled')
+            if len(model.steps) == 2:
+                scaler = model.steps[0][1]
+            model = model.steps[-1][1]
+
+        coef = np.asarray(model.coef_, dtype=np.float64)
+        intercept = np.asarray(model.intercept_, dtype=np.float64)
+        if coef.shape != (1, len(FEATURES)):
+            raise ValueError(f'Expected a binary model on {len(FEATURES)} features, got coef_ {coef.shape}')
+        if scaler is not None:
+            mean = scaler.mean_ if scaler.with_mean else np.zeros(len(FEATURES))
+            scale = scaler.scale_ if scaler.with_std else np.ones(len(FEATURES))
+            coef, intercept = fold_scaler(coef, intercept, mean, scale)
+            meta['scaler'] = {'mean': np.asarray(mean).tolist(), 'scale': np.asarray(scale).tolist()}
+        return cls(coef, intercept, model.classes_, meta)
+
+
+def fold_scaler(coef, intercept, mean, scale):
+    """Rewrite w . ((x - mean) / scale) + b as w' . x + b'."""
+    coef = np.asarray(coef, dtype=np.float64) / np.asarray(scale, dtype=np.float64)
+    intercept = np.asarray(intercept, dtype=np.float64) - coef @ np.asarray(mean, dtype=np.float64)
+    return coef, intercept
+
+
+def client_model(model, threshold):
+    """What the browser needs to score like the server (GET /api/model).
+
+    coef and intercept apply to raw CGPA / IQ, with any scaler already
+    folded in; the scaler itself is included for reference. Returns None
+    for models that can't be compiled.
+    """
+    version = getattr(model, 'version', None)
+    if not isinstance(model, CompiledScorer):
+        try:
+            model = CompiledScorer.from_model(model)
+        except (AttributeError, ValueError):
+            return None
+    return {
+        'format': CLIENT_FORMAT,
+        'format_version': FORMAT_VERSION,
+        'version': version,
+        'features': FEATURES,
+        'coef': model._w,
+        'intercept': model._b,
+        'threshold': threshold,
+        'scaler': model.meta.get('scaler'),
+    }
+
+
+def export_scorer(model_path, out_path=None):
+    """Unpickle model_path and write its compiled scorer next to it."""
+    import pickle
+
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+    out_path = out_path or scorer_path_for(model_path)
+    meta = {'source': os.path.basename(model_path), 'source_sha256': source_hash(model_path)}
+    CompiledScorer.from_model(model, meta=meta).save(out_path)
+    return out_path
+
+
+if __name__ == '__main__':
+    src = sys.argv[1] if len(sys.argv) > 1 else 'backend/model.pkl'
+    dst = sys.argv[2] if len(sys.argv) > 2 else None
+    print(f"✅ Compiled scorer written to {export_scorer(src, dst)}")
@@ -0,0 +1,316 @@
+"""Cross-validated model search: accuracy vs serving cost.
+
+    python -m predictor.search [--data placement.csv] [--folds 5] [--workers 4]
+                               [--export backend/model.pkl] [--report search.json]
+
+The notebook scores one default LogisticRegression on a single unseeded
+90/10 split. Here every candidate (logistic regression over C, solver and
+penalty, SGD, and a few non-linear classifiers) gets the same seeded
+stratified k-fold split, and candidates are scored in parallel across a
+process pool.
+
+The folds are split and scaled once and written to <data>.folds/ as .npy
+files that every worker memory-maps, so nothing is re-split or re-scaled
+per candidate and later runs reuse them while the CSV is unchanged.
+
+Each candidate is reported with its CV accuracy, the single-row predict
+latency as the servers would run it (linear models through the model
+artifact), and the size of the file they would load. The winner is the
+fastest candidate within --tolerance of the best accuracy; near-equal
+latencies go to the more accurate, then smaller, model. With --export it
+is refit on all rows and saved like predictor.train does.
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+import warnings
+from multiprocessing import Pool
+
+import numpy as np
+
+from predictor.artifact import ArtifactError, load_artifact, save_model
+from predictor.columnar import signature
+from predictor.dataset import FEATURES, TARGET, find_dataset, load_frame
+from predictor.train import export
+
+FORMAT_VERSION = 2
+META = 'meta.json'
+ARRAYS = ('X_train', 'y_train', 'X_test', 'y_test')
+
+# kind -> (module, class, fixed parameters)
+KINDS = {
+    'logreg': ('sklearn.linear_model', 'LogisticRegression', {'max_iter': 1000}),
+    'sgd': ('sklearn.linear_model', 'SGDClassifier', {'loss': 'log_loss'}),
+    'naive_bayes': ('sklearn.naive_bayes', 'GaussianNB', {}),
+    'knn': ('sklearn.neighbors', 'KNeighborsClassifier', {}),
+    'tree': ('sklearn.tree', 'DecisionTreeClassifier', {}),
+    'forest': ('sklearn.ensemble', 'RandomForestClassifier', {'n_estimators': 100}),
+    'boosting': ('sklearn.ensemble', 'HistGradientBoostingClassifier', {}),
+}
+
+# Set in each worker by _init_worker
+_folds = None
+
+
+def candidates(seed=42):
+    """[(kind, params), ...] searched by default."""
+    grid = []
+    for C in (0.01, 0.1, 1.0, 10.0, 100.0):
+        grid.append(('logreg', {'C': C, 'solver': 'lbfgs', 'penalty': 'l2'}))
+        grid.append(('logreg', {'C': C, 'solver': 'liblinear', 'penalty': 'l1'}))
+        grid.append(('logreg', {'C': C, 'solver': 'saga', 'penalty': 'l2', 'random_state': seed}))
+    for alpha in (1e-5, 1e-4, 1e-3):
+        grid.append(('sgd', {'alpha': alpha, 'average': True, 'random_state': seed}))
+    grid.append(('naive_bayes', {}))
+    for k in (5, 15, 31):
+        grid.append(('knn', {'n_neighbors': k}))
+    for depth in (3, 5, None):
+        grid.append(('tree', {'max_depth': depth, 'random_state': seed}))
+    grid.append(('forest', {'max_depth': 5, 'random_state': seed}))
+    grid.append(('boosting', {'max_depth': 3, 'random_state': seed}))
+    return grid
+
+
+def build(kind, params):
+    module, name, fixed = KINDS[kind]
+    return getattr(importlib.import_module(module), name)(**fixed, **params)
+
+
+def describe(kind, params):
+    args = ' '.join(f'{k}={v}' for k, v in params.items() if k != 'random_state')
+    return f'{kind} {args}'.strip()
+
+
+def fold_cache_dir(data_path):
+    """placement.csv -> placement.folds/"""
+    return os.path.splitext(data_path)[0] + '.folds'
+
+
+def build_folds(data_path, folds=5, seed=42, max_rows=None):
+    """Split and scale the dataset once; returns the cache directory.
+
+    Each fold's scaled train/test arrays are saved as .npy, and so is its
+    scaler's mean and scale (scaler<i>.npy, one row each). An existing cache
+    is reused if the CSV and settings match.
+    """
+    from sklearn.model_selection import StratifiedKFold
+    from sklearn.preprocessing import StandardScaler
+
+    out_dir = fold_cache_dir(data_path)
+    meta_path = os.path.join(out_dir, META)
+    key = {'format_version': FORMAT_VERSION, **signature(data_path),
+           'folds': folds, 'seed': seed, 'max_rows': max_rows}
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            cached = json.load(f)
+        if {k: cached.get(k) for k in key} == key:
+            return out_dir
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir)
+    df = load_frame(data_path)
+    X, y = df[FEATURES].to_numpy(dtype=np.float64), df[TARGET].to_numpy()
+    if max_rows is not None and len(y) > max_rows:
+        keep = np.sort(np.random.default_rng(seed).choice(len(y), max_rows, replace=False))
+        X, y = X[keep], y[keep]
+
+    splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+    for i, (train, test) in enumerate(splitter.split(X, y)):
+        scaler = StandardScaler().fit(X[train])
+        arrays = (scaler.transform(X[train]), y[train], scaler.transform(X[test]), y[test])
+        for name, array in zip(ARRAYS, arrays):
+            np.save(os.path.join(out_dir, f'{name}{i}.npy'), array)
+        np.save(os.path.join(out_dir, f'scaler{i}.npy'), np.stack([scaler.mean_, scaler.scale_]))
+    with open(meta_path, 'w') as f:
+        json.dump({**key, 'rows': int(len(y))}, f)
+    return out_dir
+
+
+def load_scaler(cache_dir, fold=0):
+    """The fitted StandardScaler of one fold, rebuilt from scaler<fold>.npy."""
+    from sklearn.preprocessing import StandardScaler
+
+    mean, scale = np.load(os.path.join(cache_dir, f'scaler{fold}.npy'))
+    scaler = StandardScaler()
+    scaler.mean_, scaler.scale_, scaler.var_ = mean, scale, scale ** 2
+    scaler.n_features_in_ = len(mean)
+    return scaler
+
+
+def load_folds(cache_dir, folds):
+    return [tuple(np.load(os.path.join(cache_dir, f'{name}{i}.npy'), mmap_mode='r') for name in ARRAYS)
+            for i in range(folds)]
+
+
+def _init_worker(cache_dir, folds):
+    global _folds
+    _folds = load_folds(cache_dir, folds)
+    warnings.simplefilter('ignore')  # ConvergenceWarning from the small-C / saga corners
+
+
+def evaluate(job):
+    """Fit and score one candidate on every fold.
+
+    Returns (index, fold accuracies, mean fit seconds, fold-0 classifier pickled).
+    """
+    index, kind, params = job
+    scores, fit_seconds, first = [], 0.0, None
+    for X_train, y_train, X_test, y_test in _folds:
+        clf = build(kind, params)
+        t = time.perf_counter()
+        clf.fit(X_train, y_train)
+        fit_seconds += time.perf_counter() - t
+        scores.append(float((clf.predict(X_test) == y_test).mean()))
+        if first is None:
+            first = clf
+    return index, scores, fit_seconds / len(_folds), pickle.dumps(first)
+
+
+def serving_cost(scaler, clf, repeat=5, number=200):
+    """(single-row latency in microseconds, bytes on disk) as the servers would load it.
+
+    Linear models are measured through the model.artifact export() writes,
+    anything else through the pickle.
+    """
+    from predictor.inference import THRESHOLD
+    from sklearn.pipeline import Pipeline
+
+    pipeline = Pipeline([('scaler', scaler), ('clf', clf)])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.artifact')
+        try:
+            save_model(pipeline, path, THRESHOLD)
+            served, size = load_artifact(path), os.path.getsize(path)
+        except ArtifactError:
+            served, size = pipeline, len(pickle.dumps(pipeline))
+    row = np.array([[7.0, 120.0]])
+    served.predict_proba(row)
+    seconds = min(timeit.repeat(lambda: served.predict_proba(row), number=number, repeat=repeat))
+    return seconds / number * 1e6, size
+
+
+def pick_winner(results, tolerance, latency_slack=1.1):
+    """Cheapest result within `tolerance` of the best mean accuracy.
+
+    Latencies within `latency_slack` of the fastest count as a tie (timing
+    noise), broken by accuracy and then artifact size.
+    """
+    best = max(r['accuracy'] for r in results)
+    eligible = [r for r in results if r['accuracy'] >= best - tolerance]
+    fastest = min(r['latency_us'] for r in eligible)
+    near = [r for r in eligible if r['latency_us'] <= fastest * latency_slack]
+    return max(near, key=lambda r: (r['accuracy'], -r['size_bytes']))
+
+
+def search(data_path, folds=5, seed=42, workers=1, max_rows=None, grid=None):
+    """Run the CV search; returns a list of result dicts in grid order."""
+    grid = grid or candidates(seed)
+    t = time.perf_counter()
+    cache_dir = build_folds(data_path, folds, seed, max_rows)
+    print(f"📂 Folds ready in {cache_dir} ({time.perf_counter() - t:.1f}s)")
+
+    jobs = [(i, kind, params) for i, (kind, params) in enumerate(grid)]
+    t = time.perf_counter()
+    if workers > 1:
+        with Pool(workers, initializer=_init_worker, initargs=(cache_dir, folds)) as pool:
+            outcomes = sorted(pool.imap_unordered(evaluate, jobs))
+    else:
+        _init_worker(cache_dir, folds)
+        outcomes = [evaluate(job) for job in jobs]
+    print(f"🔎 {len(grid)} candidates x {folds} folds in {time.perf_counter() - t:.1f}s ({workers} workers)")
+
+    # Latency is timed here, one candidate at a time, so workers don't skew it
+    scaler = load_scaler(cache_dir)
+    results = []
+    for index, scores, fit_seconds, clf in outcomes:
+        kind, params = grid[index]
+        latency, size = serving_cost(scaler, pickle.loads(clf))
+        results.append({
+            'candidate': describe(kind, params),
+            'kind': kind,
+            'params': params,
+            'accuracy': float(np.mean(scores)),
+            'accuracy_std': float(np.std(scores)),
+            'fit_ms': fit_seconds * 1000,
+            'latency_us': latency,
+            'size_bytes': size,
+        })
+    return results
+
+
+def refit(data_path, winner, folds, seed):
+    """Fit the winning candidate (with a scaler) on every row; returns (pipeline, metadata, X)."""
+    import sklearn
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    df = load_frame(data_path)
+    X, y = df[FEATURES].to_numpy(dtype=np.float64), df[TARGET].to_numpy()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        pipeline = Pipeline([('scaler', StandardScaler()),
+                             ('clf', build(winner['kind'], winner['params']))]).fit(X, y)
+    meta = {
+        'data': os.path.basename(data_path),
+        'rows': int(len(df)),
+        'seed': seed,
+        'cv_folds': folds,
+        'accuracy': winner['accuracy'],
+        'accuracy_std': winner['accuracy_std'],
+        'candidate': winner['candidate'],
+        'sklearn_version': sklearn.__version__,
+        'trained_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    }
+    return pipeline, meta, X
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cross-validated search over placement models')
+    parser.add_argument('--data', default=None, help='CSV with cgpa, iq, placement columns')
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--max-rows', type=int, default=None, help='search on a random sample of rows')
+    parser.add_argument('--tolerance', type=float, default=0.01,
+                        help='accuracy given up for a cheaper model')
+    parser.add_argument('--export', default=None, metavar='PATH', help='refit the winner and save it here')
+    parser.add_argument('--report', default=None, help='write all results as JSON')
+    args = parser.parse_args(argv)
+
+    data_path = args.data or find_dataset()
+    if data_path is None:
+        sys.exit('❌ No dataset found; pass --data')
+
+    results = search(data_path, args.folds, args.seed, max(1, args.workers), args.max_rows)
+    winner = pick_winner(results, args.tolerance)
+
+    print(f"\n{'candidate':<42} {'accuracy':>16} {'latency µs':>11} {'size B':>8} {'fit ms':>8}")
+    for r in sorted(results, key=lambda r: (-r['accuracy'], r['latency_us'])):
+        mark = ' ⭐' if r is winner else ''
+        print(f"{r['candidate']:<42} {r['accuracy']:>8.2%} ± {r['accuracy_std']:<5.1%} "
+              f"{r['latency_us']:>11.1f} {r['size_bytes']:>8} {r['fit_ms']:>8.1f}{mark}")
+    print(f"\n⭐ {winner['candidate']}: {winner['accuracy']:.2%} CV accuracy, "
+          f"{winner['latency_us']:.1f} µs per prediction, {winner['size_bytes']} B")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'winner': winner['candidate'], 'results': results}, f, indent=2)
+        print(f"💾 Results saved to {args.report}")
+
+    if args.export:
+        pipeline, meta, X = refit(data_path, winner, args.folds, args.seed)
+        scorer_path = export(pipeline, meta, args.export, X)
+        extra = ", compiled scorer and artifact next to it" if scorer_path else ''
+        print(f"💾 Winner refit on {meta['rows']} rows, saved to {args.export}{extra}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""Everything behind the predict endpoints, independent of the web framework.
+
+PredictionService owns the served model (ModelHolder), the prediction
+cache, the optional micro-batcher, the drift monitor and the dataset
+statistics. The Flask app factory (predictor.app) and the ASGI app
+(asgi.py) both wrap one.
+
+Dataset statistics are computed on the first /api/stats request, so
+pandas is only imported by processes that actually serve them.
+"""
+import threading
+
+from predictor.cache import PredictionCache
+from predictor.dataset import find_dataset
+from predictor.drift import ENABLED as DRIFT, DriftMonitor, load_profile, profile_path_for
+from predictor.inference import predict_one, threshold_for
+from predictor.loader import model_version
+from predictor.logs import setup_logging
+from predictor.microbatch import ENABLED as MICROBATCH, MicroBatcher
+from predictor.registry import WATCH, ModelHolder
+from predictor.responses import demo_prediction
+from predictor.scorer import client_model
+from predictor.stats import DatasetStats
+from predictor.surface import Surfaces
+
+MODEL_PATH = 'backend/model.pkl'
+
+DEMO_STATS = {
+    'success': True,
+    'total_students': 100,
+    'placed_students': 65,
+    'placement_rate': 65.0,
+    'avg_cgpa': 7.2,
+    'avg_iq': 128.5,
+    'data_source': 'demo'
+}
+
+SAMPLE_DATA = [
+    {'name': 'Rahul', 'cgpa': 6.8, 'iq': 123, 'placement': 1},
+    {'name': 'Priya', 'cgpa': 5.9, 'iq': 106, 'placement': 0},
+    {'name': 'Amit', 'cgpa': 5.3, 'iq': 121, 'placement': 0},
+    {'name': 'Sneha', 'cgpa': 7.4, 'iq': 132, 'placement': 1},
+    {'name': 'Vikram', 'cgpa': 5.8, 'iq': 142, 'placement': 0},
+    {'name': 'Neha', 'cgpa': 8.1, 'iq': 135, 'placement': 1},
+    {'name': 'Raj', 'cgpa': 7.2, 'iq': 128, 'placement': 1},
+    {'name': 'Anjali', 'cgpa': 6.5, 'iq': 118, 'placement': 1},
+    {'name': 'Karan', 'cgpa': 5.5, 'iq': 110, 'placement': 0},
+    {'name': 'Pooja', 'cgpa': 7.8, 'iq': 140, 'placement': 1}
+]
+
+
+class PredictionService:
+    def __init__(self, model_path=MODEL_PATH, dataset_dir='.', microbatch=MICROBATCH):
+        # Cache of recent predictions, keyed on (cgpa, iq) and model version
+        self.cache = PredictionCache()
+        # Incoming features and P(placed) against the model's training profile (DRIFT_MONITOR=0 to skip)
+        self.monitor = DriftMonitor() if DRIFT else None
+        # Served model (and its PREDICT_TABLE lookup table), swapped atomically on reload
+        self.models = ModelHolder(model_path, on_swap=self._on_swap)
+        # Coalesces concurrent single predictions into one model call (MICROBATCH=1)
+        self.batcher = MicroBatcher(lambda: self.models.model) if microbatch else None
+        self.dataset_dir = dataset_dir
+        self._dataset_stats = None
+        self._dataset_lock = threading.Lock()
+        self._client_model = (None, None)  # (model, GET /api/model payload)
+        # Probability surfaces and binned dataset points for /api/surface
+        self.surfaces = Surfaces()
+
+    def _on_swap(self, model):
+        self.cache.clear()
+        if self.monitor is not None:
+            self.monitor.reset(load_profile(profile_path_for(self.models.path)))
+
+    def load(self):
+        """Load the model (falling back to demo mode) and start the watcher."""
+        path = self.models.path
+        try:
+            self.models.load()
+            print(f"✅ Model loaded successfully from {path}")
+        except FileNotFoundError:
+            print("⚠️ Model file not found, using demo mode")
+        except Exception as e:
+            print(f"⚠️ Error loading model: {e}, using demo mode")
+        if WATCH:
+            self.models.start_watcher()
+        return self
+
+    def predict(self, cgpa, iq):
+        """Returns (prediction, probability, model_type, model) for one student."""
+        model, lookup_table = self.models.current
+        if model is None:
+            prediction, probability = demo_prediction(cgpa, iq)
+            return prediction, probability, 'demo', None
+        if self.batcher is not None:
+            prediction, probability, model = self.batcher.predict(cgpa, iq)
+        else:
+            prediction, probability = predict_one(model, cgpa, iq, cache=self.cache, table=lookup_table)
+        self.observe(cgpa, iq, prediction, probability)
+        return prediction, probability, 'real', model
+
+    def observe(self, cgpa, iq, prediction, probability):
+        """Feed one model prediction to the drift monitor."""
+        if self.monitor is not None:
+            self.monitor.record(cgpa, iq, probability if prediction else 1.0 - probability)
+
+    @property
+    def dataset_stats(self):
+        """DatasetStats for the dataset under dataset_dir, or None if there isn't one."""
+        if self._dataset_stats is None and self.dataset_dir is not None:
+            with self._dataset_lock:
+                if self._dataset_stats is None:
+                    path = find_dataset(self.dataset_dir)
+                    if path is None:
+                        print("⚠️ Dataset not found, using sample data")
+                        self.dataset_dir = None
+                        return None
+                    stats = DatasetStats(path)
+                    payload, _ = stats.snapshot()
+                    print(f"✅ Dataset loaded: {payload['total_students']} records")
+                    self._dataset_stats = stats
+        return self._dataset_stats
+
+    def stats_snapshot(self):
+        """(payload, etag) for /api/stats, or (DEMO_STATS, None) without a dataset."""
+        try:
+            stats = self.dataset_stats
+            if stats is not None:
+                return stats.snapshot()
+        except Exception as e:
+            print(f"⚠️ Error reading dataset: {e}")
+        return DEMO_STATS, None
+
+    def client_model(self):
+        """(payload, etag) for GET /api/model, or (None, None) without a real model."""
+        model = self.models.model
+        if model is None:
+            return None, None
+        cached_model, payload = self._client_model
+        if cached_model is not model:
+            payload = client_model(model, threshold_for(model))
+            self._client_model = (model, payload)
+        if payload is None:
+            return None, None
+        return payload, payload['version']
+
+    def drift_report(self):
+        """GET /api/drift payload, or None with monitoring off."""
+        if self.monitor is None:
+            return None
+        return self.monitor.report(model_version(self.models.model))
+
+    def warm_up(self):
+        """Compute dataset stats now, e.g. in a preforking master."""
+        self.stats_snapshot()
+
+    def after_fork(self):
+        self.models.after_fork()
+        if self.monitor is not None:
+            self.monitor.reset(self.monitor.reference)
+        setup_logging()
+
+    def status(self):
+        return {
+            'status': 'online',
+            **self.models.status(),
+            'cache': self.cache.stats(),
+            'table_mode': self.models.current[1] is not None,
+            'surface_cache': self.surfaces.stats()['surfaces'],
+            'microbatch': self.batcher.stats() if self.batcher is not None else None
+        }
@@ -0,0 +1,182 @@
+"""Dataset statistics for /api/stats, computed once and kept up to date.
+
+DatasetStats watches the CSV's size and mtime. Nothing is re-read while the
+file is unchanged; when rows are appended only the new bytes are parsed and
+folded into the running aggregates; any other change triggers a full rescan.
+Per-band breakdowns (CGPA band, IQ band) are maintained alongside.
+Rows are read with predictor.dataset.iter_chunks, so memory stays bounded,
+and a fresh columnar cache (predictor.columnar) skips CSV parsing entirely.
+"""
+import copy
+import csv
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from predictor.columnar import load_columns
+from predictor.dataset import CHUNK_ROWS, COLUMNS, iter_chunks, last_line_end, read_header
+
+CGPA_BAND = 1.0   # 0-1, 1-2, ... 9-10
+IQ_BAND = 10      # 50-60, 60-70, ...
+TAIL_BYTES = 64   # bytes re-checked to detect a rewrite rather than an append
+
+
+class Aggregates:
+    def __init__(self):
+        self.count = 0
+        self.placed = 0
+        self.sum_cgpa = 0.0
+        self.sum_iq = 0.0
+        self.n_cgpa = 0       # finite values behind each sum, like pandas mean()
+        self.n_iq = 0
+        self.cgpa_bands = {}  # (lo, hi) -> [students, placed]
+        self.iq_bands = {}
+        self.unbanded = 0     # blank or non-finite cgpa/iq cells left out of the bands
+
+    def add_chunk(self, cgpa, iq, placement):
+        """Fold arrays of rows into the aggregates."""
+        self.count += len(cgpa)
+        self.placed += int(placement.sum())
+        finite_cgpa = cgpa[np.isfinite(cgpa)]
+        finite_iq = iq[np.isfinite(iq)]
+        self.sum_cgpa += float(finite_cgpa.sum(dtype=np.float64))
+        self.sum_iq += float(finite_iq.sum(dtype=np.float64))
+        self.n_cgpa += len(finite_cgpa)
+        self.n_iq += len(finite_iq)
+        for bands, values, width in ((self.cgpa_bands, cgpa, CGPA_BAND), (self.iq_bands, iq, IQ_BAND)):
+            # Blank cells have no band; group by the bands present so one
+            # outlier doesn't size the histogram
+            finite = np.isfinite(values)
+            self.unbanded += len(values) - int(finite.sum())
+            if not finite.any():
+                continue
+            keys, index = np.unique(np.floor(values[finite] / width).astype(np.int64), return_inverse=True)
+            students = np.bincount(index)
+            placed = np.bincount(index, weights=placement[finite])
+            for k, n, p in zip(keys.tolist(), students.tolist(), placed.tolist()):
+                counts = bands.setdefault((k * width, (k + 1) * width), [0, 0])
+                counts[0] += n
+                counts[1] += int(p)
+
+    @staticmethod
+    def _bands_to_list(bands, fmt):
+        return [
+            {
+                'band': f'{fmt(lo)}-{fmt(hi)}',
+                'students': n,
+                'placed': placed,
+                'placement_rate': round(placed / n * 100, 2),
+            }
+            for (lo, hi), (n, placed) in sorted(bands.items())
+        ]
+
+    def to_dict(self):
+        total = self.count
+        return {
+            'total_students': total,
+            'placed_students': self.placed,
+            'placement_rate': round(self.placed / total * 100, 2) if total else 0.0,
+            'avg_cgpa': round(self.sum_cgpa / self.n_cgpa, 2) if self.n_cgpa else 0.0,
+            'avg_iq': round(self.sum_iq / self.n_iq, 2) if self.n_iq else 0.0,
+            'unbanded_values': self.unbanded,
+            'bands': {
+                'cgpa': self._bands_to_list(self.cgpa_bands, lambda v: f'{v:g}'),
+                'iq': self._bands_to_list(self.iq_bands, lambda v: f'{v:g}'),
+            },
+        }
+
+
+class DatasetStats:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None   # (size, mtime_ns) last seen
+        self._offset = 0         # bytes consumed, always at a line boundary
+        self._tail = b''
+        self._pending = None     # last line when the file doesn't end in a newline
+        self._agg = None
+        self._payload = None
+        self.etag = None
+        self.full_scans = 0
+        self.incremental_updates = 0
+        self.columnar_loads = 0
+
+    def snapshot(self):
+        """Return (payload dict, etag), refreshing first if the file changed."""
+        self.refresh()
+        return self._payload, self.etag
+
+    def refresh(self):
+        st = os.stat(self.path)
+        signature = (st.st_size, st.st_mtime_ns)
+        if signature == self._signature:
+            return
+        with self._lock:
+            if signature == self._signature:
+                return
+            with open(self.path, 'rb') as f:
+                if self._agg is not None and self._is_append(f, st.st_size):
+                    self._read_rows(f, self._offset)
+                    self.incremental_updates += 1
+                else:
+                    self._full_scan(f)
+            self._signature = signature
+            agg = self._agg
+            if self._pending is not None:
+                agg = copy.deepcopy(agg)
+                agg.add_chunk(*(np.array([v]) for v in self._pending))
+            self._payload = dict(agg.to_dict(), success=True,
+                                 data_source=os.path.basename(self.path))
+            self.etag = hashlib.sha1(repr((self._signature, self._offset)).encode()).hexdigest()[:16]
+
+    def _is_append(self, f, size):
+        if size < self._offset:
+            return False
+        start = max(0, self._offset - TAIL_BYTES)
+        f.seek(start)
+        return f.read(self._offset - start) == self._tail
+
+    def _full_scan(self, f):
+        read_header(f)
+        offset = f.tell()
+        self._agg = Aggregates()
+        cached = load_columns(self.path)
+        if cached is not None:
+            # Fold the memory-mapped columns; only bytes after them are parsed
+            columns, meta = cached
+            for i in range(0, meta['rows'], CHUNK_ROWS):
+                self._agg.add_chunk(*(columns[c][i:i + CHUNK_ROWS] for c in COLUMNS))
+            offset = meta['offset']
+            self.columnar_loads += 1
+        self._read_rows(f, offset)
+        self.full_scans += 1
+
+    def _read_rows(self, f, offset):
+        # Stop at the last complete line; a writer may be mid-append
+        size = os.fstat(f.fileno()).st_size
+        end = last_line_end(f, offset, size)
+        if end > offset:
+            for chunk in iter_chunks(self.path, start=offset, end=end):
+                self._agg.add_chunk(*(chunk[c].to_numpy() for c in COLUMNS))
+
+        # Count an unterminated last line, but keep it out of the running
+        # aggregates so it isn't added twice once the line is finished
+        self._pending = None
+        f.seek(end)
+        rest = f.read(size - end).decode('utf-8').strip()
+        if rest:
+            header = read_header(f)
+            try:
+                row = dict(zip(header, next(csv.reader([rest]))))
+                # Blank cells read as NaN, as pandas parses them in full lines
+                self._pending = (float(row['cgpa'] or 'nan'), float(row['iq'] or 'nan'),
+                                 int(float(row['placement'])))
+            except (KeyError, ValueError):
+                pass
+        self._offset = end
+        start = max(0, end - TAIL_BYTES)
+        f.seek(start)
+        self._tail = f.read(end - start)
+
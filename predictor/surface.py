@@ -0,0 +1,208 @@
+"""Probability surface over a CGPA x IQ grid, for decision-boundary plots.
+
+    GET /api/surface?cgpa_min=0&cgpa_max=10&cgpa_steps=101
+                    &iq_min=50&iq_max=200&iq_steps=151
+                    [&format=base64|binary][&points=1]
+
+P(placed) is computed for every grid node in one predict_proba call and
+returned as little-endian float32, CGPA-major (row i is cgpa[i], column j
+is iq[j]). format=base64 (default) wraps it in JSON with the grid;
+format=binary sends the raw bytes with the grid in X-Surface-* headers.
+Surfaces are cached per (model version, grid), so a dashboard redrawing
+the same view costs a dictionary lookup.
+
+points=1 (JSON only) adds the dataset snapped to the nearest grid node:
+per non-empty node its cgpa, iq, number of students and number placed,
+which is all a scatter overlay needs however large the CSV is.
+"""
+import base64
+import hashlib
+import math
+import os
+
+import numpy as np
+
+from predictor import codec
+from predictor.cache import PredictionCache
+from predictor.columnar import load_columns
+from predictor.dataset import CHUNK_ROWS, iter_chunks
+from predictor.inference import threshold_for
+from predictor.loader import model_version
+
+SURFACE_CACHE_SIZE = int(os.environ.get('SURFACE_CACHE_SIZE', 64))
+MAX_STEPS = 1000
+MAX_POINTS = 250000  # grid nodes per request (1 MB of float32)
+FORMATS = ('base64', 'binary')
+
+DEFAULTS = {
+    'cgpa_min': 0.0, 'cgpa_max': 10.0, 'cgpa_steps': 101,
+    'iq_min': 50.0, 'iq_max': 200.0, 'iq_steps': 151,
+}
+
+
+class SurfaceError(ValueError):
+    """Raised when a surface request asks for an invalid grid."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class GridSpec(tuple):
+    """(cgpa_min, cgpa_max, cgpa_steps, iq_min, iq_max, iq_steps); hashable cache key."""
+
+    @classmethod
+    def from_args(cls, args):
+        values = {}
+        for name, default in DEFAULTS.items():
+            raw = args.get(name)
+            if raw is None:
+                values[name] = default
+                continue
+            try:
+                values[name] = int(raw) if name.endswith('_steps') else float(raw)
+            except ValueError:
+                raise SurfaceError(f"'{name}' must be a number")
+            if not math.isfinite(values[name]):
+                raise SurfaceError(f"'{name}' must be finite")
+        for axis in ('cgpa', 'iq'):
+            if not values[f'{axis}_min'] < values[f'{axis}_max']:
+                raise SurfaceError(f"'{axis}_min' must be less than '{axis}_max'")
+            if not 2 <= values[f'{axis}_steps'] <= MAX_STEPS:
+                raise SurfaceError(f"'{axis}_steps' must be between 2 and {MAX_STEPS}")
+        if values['cgpa_steps'] * values['iq_steps'] > MAX_POINTS:
+            raise SurfaceError(f'Grid has more than {MAX_POINTS} points')
+        return cls(values[name] for name in DEFAULTS)
+
+    @property
+    def shape(self):
+        return self[2], self[5]
+
+    def axes(self):
+        return np.linspace(self[0], self[1], self[2]), np.linspace(self[3], self[4], self[5])
+
+    def to_dict(self):
+        return {
+            'cgpa': {'min': self[0], 'max': self[1], 'steps': self[2]},
+            'iq': {'min': self[3], 'max': self[4], 'steps': self[5]},
+        }
+
+
+def probability_surface(model, spec):
+    """P(placed) at every grid node: a (cgpa_steps, iq_steps) float32 array."""
+    cgpa, iq = spec.axes()
+    cc, ii = np.meshgrid(cgpa, iq, indexing='ij')
+    X = np.column_stack([cc.ravel(), ii.ravel()])
+    return model.predict_proba(X)[:, 1].astype('<f4').reshape(spec.shape)
+
+
+def _snap(values, lo, hi, steps):
+    """Index of the nearest grid node, or -1 outside [lo, hi]."""
+    idx = np.rint((values - lo) / (hi - lo) * (steps - 1)).astype(np.int64)
+    idx[(values < lo) | (values > hi)] = -1
+    return idx
+
+
+def bin_points(path, spec):
+    """Dataset rows counted per nearest grid node (non-empty nodes only)."""
+    students = np.zeros(spec.shape[0] * spec.shape[1], dtype=np.int64)
+    placed = np.zeros_like(students)
+    cached = load_columns(path)
+    if cached is not None:
+        columns, meta = cached
+        chunks = ((columns['cgpa'][i:i + CHUNK_ROWS], columns['iq'][i:i + CHUNK_ROWS],
+                   columns['placement'][i:i + CHUNK_ROWS]) for i in range(0, meta['rows'], CHUNK_ROWS))
+    else:
+        chunks = ((c['cgpa'].to_numpy(), c['iq'].to_numpy(), c['placement'].to_numpy())
+                  for c in iter_chunks(path))
+    for cgpa, iq, placement in chunks:
+        ci = _snap(cgpa, spec[0], spec[1], spec[2])
+        ii = _snap(iq, spec[3], spec[4], spec[5])
+        inside = (ci >= 0) & (ii >= 0)
+        flat = ci[inside] * spec[5] + ii[inside]
+        students += np.bincount(flat, minlength=len(students))
+        placed += np.bincount(flat, weights=placement[inside], minlength=len(students)).astype(np.int64)
+
+    nodes = np.flatnonzero(students)
+    cgpa_axis, iq_axis = spec.axes()
+    return {
+        'cgpa': cgpa_axis[nodes // spec[5]].round(6).tolist(),
+        'iq': iq_axis[nodes % spec[5]].round(6).tolist(),
+        'students': students[nodes].tolist(),
+        'placed': placed[nodes].tolist(),
+    }
+
+
+class Surfaces:
+    """Surface bytes per (model version, grid) and binned points per (dataset, grid)."""
+
+    def __init__(self, maxsize=SURFACE_CACHE_SIZE):
+        self.surfaces = PredictionCache(maxsize, ttl=0)
+        self.points = PredictionCache(maxsize, ttl=0)
+
+    def surface(self, model, spec):
+        version = model_version(model)
+        data = self.surfaces.get(spec, version)
+        if data is None:
+            data = probability_surface(model, spec).tobytes()
+            self.surfaces.put(spec, version, data)
+        return data
+
+    def binned(self, stats, spec):
+        """Binned dataset for a DatasetStats (refreshed first), or None without one."""
+        if stats is None:
+            return None, None
+        _, etag = stats.snapshot()
+        points = self.points.get(spec, etag)
+        if points is None:
+            points = bin_points(stats.path, spec)
+            self.points.put(spec, etag, points)
+        return points, etag
+
+    def stats(self):
+        return {'surfaces': self.surfaces.stats(), 'points': self.points.stats()}
+
+
+def render(service, args):
+    """(body, content type, headers, etag) for a surface request.
+
+    Shared by the Flask and ASGI apps; raises SurfaceError for bad input
+    and when no real model is loaded.
+    """
+    model = service.models.model
+    if model is None:
+        raise SurfaceError('Model not loaded', status=503)
+    spec = GridSpec.from_args(args)
+    fmt = args.get('format', 'base64')
+    if fmt not in FORMATS:
+        raise SurfaceError(f"'format' must be one of {', '.join(FORMATS)}")
+    with_points = args.get('points') == '1'
+    if with_points and fmt == 'binary':
+        raise SurfaceError("'points' needs format=base64")
+
+    version = model_version(model)
+    data = service.surfaces.surface(model, spec)
+    points, dataset = service.surfaces.binned(service.dataset_stats, spec) if with_points else (None, None)
+    etag = hashlib.sha1(repr((version, spec, fmt, with_points, dataset)).encode()).hexdigest()[:16]
+
+    if fmt == 'binary':
+        headers = {
+            'X-Model-Version': str(version),
+            'X-Surface-Shape': f'{spec[2]},{spec[5]}',
+            'X-Surface-Grid': f'cgpa={spec[0]}:{spec[1]}:{spec[2]};iq={spec[3]}:{spec[4]}:{spec[5]}',
+            'X-Surface-Dtype': 'float32-le',
+        }
+        return data, 'application/octet-stream', headers, etag
+
+    payload = {
+        'model_version': version,
+        'threshold': threshold_for(model),
+        **spec.to_dict(),
+        'shape': list(spec.shape),
+        'dtype': 'float32-le',
+        'order': 'cgpa-major',
+        'probabilities': base64.b64encode(data).decode('ascii'),
+    }
+    if with_points:
+        payload['points'] = points
+    return codec.dumps(payload), 'application/json', {}, etag
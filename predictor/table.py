@@ -0,0 +1,99 @@
+"""Table mode: P(placed) precomputed over the whole input grid.
+
+The frontend only allows CGPA 0-10 (0.1 steps) and IQ 50-200, which is
+101 x 151 points. With PREDICT_TABLE=1 the model is evaluated over that grid
+once at load time, and an on-grid prediction becomes a single array index.
+Off-grid or out-of-range inputs fall back to live inference.
+
+With PREDICT_TABLE_FILE=1 the table is saved as model.table-<version>.npy
+next to the model and memory-mapped, so worker processes share one copy.
+"""
+import os
+
+import numpy as np
+
+from predictor.cache import quantize
+from predictor.loader import model_version
+
+TABLE_MODE = os.environ.get('PREDICT_TABLE', '0') == '1'
+TABLE_FILE = os.environ.get('PREDICT_TABLE_FILE', '0') == '1'
+
+# Grid in quantized units: CGPA * 10 and IQ
+CGPA_RANGE = (0, 100)
+IQ_RANGE = (50, 200)
+SHAPE = (CGPA_RANGE[1] - CGPA_RANGE[0] + 1, IQ_RANGE[1] - IQ_RANGE[0] + 1)
+
+
+def grid_points():
+    """All grid points as an (n, 2) matrix, CGPA-major."""
+    cgpa = np.arange(CGPA_RANGE[0], CGPA_RANGE[1] + 1) / 10
+    iq = np.arange(IQ_RANGE[0], IQ_RANGE[1] + 1, dtype=np.float64)
+    cc, ii = np.meshgrid(cgpa, iq, indexing='ij')
+    return np.column_stack([cc.ravel(), ii.ravel()])
+
+
+def table_path_for(model_path, version):
+    """backend/model.pkl -> backend/model.table-<version>.npy"""
+    return f"{os.path.splitext(model_path)[0]}.table-{version}.npy"
+
+
+class LookupTable:
+    def __init__(self, probs, version):
+        if probs.shape != SHAPE:
+            raise ValueError(f'Lookup table has shape {probs.shape}, expected {SHAPE}')
+        self.probs = probs
+        self.version = version
+
+    @classmethod
+    def build(cls, model):
+        """Evaluate the model over the grid in one vectorized pass."""
+        probs = model.predict_proba(grid_points())[:, 1].astype(np.float32)
+        return cls(probs.reshape(SHAPE), model_version(model))
+
+    def lookup(self, cgpa, iq):
+        """P(placed) from the table, or None if (cgpa, iq) isn't on the grid."""
+        key = quantize(cgpa, iq)
+        if key is None:
+            return None
+        c, i = key
+        if not (CGPA_RANGE[0] <= c <= CGPA_RANGE[1] and IQ_RANGE[0] <= i <= IQ_RANGE[1]):
+            return None
+        return float(self.probs[c - CGPA_RANGE[0], i - IQ_RANGE[0]])
+
+    def save(self, path):
+        # Write to a temp file first so other workers never map a partial table
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            np.save(f, self.probs)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, version):
+        return cls(np.load(path, mmap_mode='r'), version)
+
+
+def load_table(model, model_path, use_file=TABLE_FILE):
+    """Build (or map from disk) the lookup table for a loaded model."""
+    version = model_version(model)
+    if use_file and version is not None:
+        path = table_path_for(model_path, version)
+        if os.path.exists(path):
+            try:
+                return LookupTable.load(path, version)
+            except ValueError:
+                pass  # wrong shape, rebuild below
+        table = LookupTable.build(model)
+        table.save(path)
+        return LookupTable.load(path, version)
+    return LookupTable.build(model)
+
+
+def maybe_load_table(model, model_path):
+    """load_table() when table mode is on and a model is loaded, else None."""
+    if not TABLE_MODE or model is None:
+        return None
+    try:
+        return load_table(model, model_path)
+    except Exception as e:
+        print(f"⚠️ Could not build lookup table, using live inference: {e}")
+        return None
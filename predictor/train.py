@@ -0,0 +1,113 @@
+"""Train the placement model and export it for the servers.
+
+Mirrors end_to_end_ml.ipynb (StandardScaler + LogisticRegression on a 90/10
+split) but saves the scaler and classifier together as one Pipeline, so
+the servers no longer feed raw CGPA/IQ to a model trained on scaled inputs.
+The compiled scorer is written alongside with the scaling folded in, and
+so is the training data's drift profile (predictor.drift).
+
+    python -m predictor.train [--data placement.csv] [--out backend/model.pkl]
+"""
+import argparse
+import datetime
+import os
+import pickle
+import sys
+
+from predictor.artifact import artifact_path_for, save_model
+from predictor.dataset import FEATURES, TARGET, find_dataset, load_frame
+from predictor.drift import build_profile, profile_path_for, save_profile
+from predictor.scorer import CompiledScorer, scorer_path_for, source_hash
+
+
+def build_pipeline():
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    return Pipeline([('scaler', StandardScaler()), ('clf', LogisticRegression())])
+
+
+def train(data_path, test_size=0.1, seed=42):
+    """Fit the pipeline; returns (pipeline, metadata, training features)."""
+    import sklearn
+    from sklearn.metrics import accuracy_score
+    from sklearn.model_selection import train_test_split
+
+    df = load_frame(data_path)
+    X, y = df[FEATURES].to_numpy(dtype='float64'), df[TARGET].to_numpy()
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=seed, stratify=y)
+
+    pipeline = build_pipeline().fit(X_train, y_train)
+    meta = {
+        'data': os.path.basename(data_path),
+        'rows': int(len(df)),
+        'test_size': test_size,
+        'seed': seed,
+        'accuracy': float(accuracy_score(y_test, pipeline.predict(X_test))),
+        'sklearn_version': sklearn.__version__,
+        'trained_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    }
+    return pipeline, meta, X_train
+
+
+def export(pipeline, meta, out_path, training_data=None):
+    """Pickle the pipeline to out_path, with its artifact and compiled scorer next to it.
+
+    training_data (an (n, 2) array or an iterable of them) is profiled
+    into <out>.profile.json for the drift monitor.
+
+    The artifact and scorer record the pickle's sha256, so the servers
+    can tell they still match it. Returns the scorer path, or None for
+    models that aren't a logistic regression (any stale artifact / scorer is removed so the servers load
+    the pickle).
+    """
+    from predictor.inference import THRESHOLD
+
+    # Write beside the target and rename, so a watching server never reads half a pickle
+    tmp = out_path + '.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(pipeline, f)
+    os.replace(tmp, out_path)
+    profile_path = profile_path_for(out_path)
+    if training_data is not None:
+        save_profile(build_profile(pipeline, training_data, meta), profile_path)
+    elif os.path.exists(profile_path):
+        os.remove(profile_path)  # it described an older model
+    scorer_path = scorer_path_for(out_path)
+    artifact_path = artifact_path_for(out_path)
+    meta = {**meta, 'source_sha256': source_hash(out_path)}
+    try:
+        scorer = CompiledScorer.from_model(pipeline, meta=meta)
+    except (AttributeError, ValueError):
+        for stale in (scorer_path, artifact_path):
+            if os.path.exists(stale):
+                os.remove(stale)
+        return None
+    scorer.save(scorer_path)
+    save_model(pipeline, artifact_path, THRESHOLD, meta)
+    return scorer_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train and export the placement model')
+    parser.add_argument('--data', default=None, help='CSV with cgpa, iq, placement columns')
+    parser.add_argument('--out', default='backend/model.pkl')
+    parser.add_argument('--test-size', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    data_path = args.data or find_dataset()
+    if data_path is None:
+        sys.exit('❌ No dataset found; pass --data')
+
+    pipeline, meta, X_train = train(data_path, args.test_size, args.seed)
+    scorer_path = export(pipeline, meta, args.out, X_train)
+    print(f"✅ Trained on {meta['rows']} rows from {data_path} (test accuracy {meta['accuracy']:.2%})")
+    print(f"💾 Pipeline saved to {args.out}, compiled scorer to {scorer_path}, "
+          f"artifact to {artifact_path_for(args.out)}, drift profile to {profile_path_for(args.out)}")
+
+
+if __name__ == '__main__':
+    main()
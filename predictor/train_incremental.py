@@ -0,0 +1,155 @@
+"""Out-of-core training with partial_fit.
+
+Streams the CSV through predictor.dataset.iter_chunks, so the dataset never
+has to fit in memory:
+
+  1. StandardScaler.partial_fit over every chunk (running mean/variance)
+  2. SGDClassifier(loss='log_loss').partial_fit over the scaled chunks,
+     for --epochs passes
+
+With --resume the existing artifact is loaded and only rows appended since
+it was trained are learned (or the whole --data file, if it's a different
+file, e.g. a new cohort). The scaler is kept frozen when resuming so the
+learned weights stay in the same feature space.
+
+    python -m predictor.train_incremental --data placement.csv [--resume]
+
+Each run writes backend/model.pkl, its compiled scorer and drift profile,
+plus versioned copies (model.v<N>.pkl / model.v<N>.scorer.json / ...).
+"""
+import argparse
+import datetime
+import os
+import pickle
+import shutil
+import sys
+
+import numpy as np
+
+from predictor.artifact import artifact_path_for
+from predictor.dataset import (CHUNK_ROWS, FEATURES, TARGET, find_dataset, iter_chunks,
+                               last_line_end, read_header)
+from predictor.drift import profile_path_for
+from predictor.scorer import scorer_path_for
+from predictor.train import export
+
+CLASSES = np.array([0, 1])
+
+
+def build_pipeline(seed=42):
+    from sklearn.linear_model import SGDClassifier
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    clf = SGDClassifier(loss='log_loss', alpha=1e-4, average=True, random_state=seed)
+    return Pipeline([('scaler', StandardScaler()), ('clf', clf)])
+
+
+def _data_range(path, start=None):
+    """Byte range of complete data lines, from `start` (default: after header)."""
+    with open(path, 'rb') as f:
+        read_header(f)
+        first = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        start = first if start is None else start
+        return start, last_line_end(f, start, size)
+
+
+def _chunks(path, start, end, chunksize):
+    for chunk in iter_chunks(path, chunksize, start=start, end=end):
+        yield chunk[FEATURES].to_numpy(dtype=np.float64), chunk[TARGET].to_numpy()
+
+
+def fit_incremental(pipeline, data_path, start, end, epochs=5, chunksize=CHUNK_ROWS,
+                    fit_scaler=True, seed=42):
+    """Stream [start, end) of data_path into the pipeline; returns (rows, accuracy).
+
+    Accuracy is progressive validation over the last epoch: each chunk is
+    scored before the model learns from it.
+    """
+    scaler, clf = pipeline.named_steps['scaler'], pipeline.named_steps['clf']
+    if fit_scaler:
+        for X, _ in _chunks(data_path, start, end, chunksize):
+            scaler.partial_fit(X)
+
+    rng = np.random.default_rng(seed)
+    for _ in range(epochs):
+        rows = correct = scored = 0
+        for X, y in _chunks(data_path, start, end, chunksize):
+            order = rng.permutation(len(y))  # exports are often sorted by cohort
+            X, y = scaler.transform(X[order]), y[order]
+            if hasattr(clf, 'coef_'):
+                correct += int((clf.predict(X) == y).sum())
+                scored += len(y)
+            clf.partial_fit(X, y, classes=CLASSES)
+            rows += len(y)
+    return rows, (correct / scored if scored else None)
+
+
+def main(argv=None):
+    import sklearn
+
+    parser = argparse.ArgumentParser(description='Train the placement model out-of-core with partial_fit')
+    parser.add_argument('--data', default=None, help='CSV with cgpa, iq, placement columns')
+    parser.add_argument('--out', default='backend/model.pkl')
+    parser.add_argument('--resume', action='store_true', help='continue from the artifact at --out')
+    parser.add_argument('--epochs', type=int, default=5)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    data_path = args.data or find_dataset()
+    if data_path is None:
+        sys.exit('❌ No dataset found; pass --data')
+
+    previous = {}
+    start = None
+    if args.resume:
+        with open(args.out, 'rb') as f:
+            pipeline = pickle.load(f)
+        previous = getattr(pipeline, 'training_meta', None)
+        if previous is None or not hasattr(pipeline.named_steps.get('clf'), 'partial_fit'):
+            sys.exit(f'❌ {args.out} was not trained incrementally; run without --resume first')
+        if previous.get('data') == os.path.basename(data_path):
+            start = previous['data_offset']
+    else:
+        pipeline = build_pipeline(args.seed)
+
+    start, end = _data_range(data_path, start)
+    if start >= end:
+        sys.exit(f'✅ No new rows in {data_path} since version {previous.get("version")}')
+
+    rows, accuracy = fit_incremental(pipeline, data_path, start, end, args.epochs, args.chunk_rows,
+                                     fit_scaler=not args.resume, seed=args.seed)
+    version = previous.get('version', 0) + 1
+    meta = {
+        'version': version,
+        'data': os.path.basename(data_path),
+        'data_offset': end,
+        'rows': previous.get('rows', 0) + rows,
+        'new_rows': rows,
+        'epochs': args.epochs,
+        'progressive_accuracy': accuracy,
+        'sklearn_version': sklearn.__version__,
+        'trained_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    }
+    pipeline.training_meta = meta
+    # Profiled over every row of --data learned so far, one chunk at a time
+    first, _ = _data_range(data_path)
+    profile_data = (X for X, _ in _chunks(data_path, first, end, args.chunk_rows))
+    scorer_path = export(pipeline, meta, args.out, profile_data)
+
+    base = os.path.splitext(args.out)[0]
+    shutil.copyfile(args.out, f'{base}.v{version}.pkl')
+    shutil.copyfile(scorer_path, scorer_path_for(f'{base}.v{version}.pkl'))
+    shutil.copyfile(artifact_path_for(args.out), artifact_path_for(f'{base}.v{version}.pkl'))
+    shutil.copyfile(profile_path_for(args.out), profile_path_for(f'{base}.v{version}.pkl'))
+
+    acc = f'{accuracy:.2%}' if accuracy is not None else 'n/a'
+    print(f"✅ Version {version}: learned {rows} rows from {data_path} "
+          f"({meta['rows']} total, progressive accuracy {acc})")
+    print(f"💾 Saved {args.out}, {scorer_path} and {base}.v{version}.pkl")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Production server: the Flask app under gunicorn with preforked workers.
+
+    python serve.py [--app run] [--workers 4] [--threads 2] [--port 8080]
+
+The app module (and so the model, lookup table and dataset stats) is
+imported once in the master before forking, so workers share that memory
+copy-on-write. SIGTERM/SIGINT stop accepting connections and let in-flight
+requests finish for up to --graceful-timeout seconds.
+"""
+import argparse
+import gc
+import importlib
+import multiprocessing
+import os
+import sys
+
+APPS = {
+    'run': 'run',                  # full frontend + API
+    'placement': 'placement_app',  # single-page app
+}
+
+
+def _post_fork(service):
+    def post_fork(server, worker):
+        # Threads don't survive fork; restart the model watcher per worker
+        service.after_fork()
+    return post_fork
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the placement predictor with gunicorn')
+    parser.add_argument('--app', choices=sorted(APPS), default='run')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8080)))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count())))
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('WEB_THREADS', 2)))
+    parser.add_argument('--timeout', type=int, default=30, help='kill workers silent for this long')
+    parser.add_argument('--graceful-timeout', type=int, default=30)
+    args = parser.parse_args(argv)
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        sys.exit('❌ gunicorn is not installed: pip install -r backend/requirements.txt')
+
+    # Relative paths in the apps (backend/model.pkl, frontend/) are from the repo root
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.getcwd())
+    module = importlib.import_module(APPS[args.app])
+    service = module.app.extensions['predictor']
+    service.warm_up()  # dataset stats too, so workers don't each compute them
+    # Keep the GC from touching (and so copying) preloaded objects in workers
+    gc.freeze()
+
+    options = {
+        'bind': f'{args.host}:{args.port}',
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'preload_app': True,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'post_fork': _post_fork(service),
+        'accesslog': None,
+    }
+
+    class Server(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return module.app
+
+    print(f"🚀 Serving {APPS[args.app]}:app on http://{args.host}:{args.port} "
+          f"({args.workers} workers x {args.threads} threads)")
+    Server().run()
+
+
+if __name__ == '__main__':
+    main()
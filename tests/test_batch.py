@@ -0,0 +1,31 @@
+"""CSV batches follow the same finite-number rules as JSON predictions."""
+import io
+import os
+
+import pytest
+
+from predictor.app import create_app
+from predictor.batch import BatchError, csv_to_matrix
+
+MODEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend', 'model.pkl')
+
+
+def test_csv_batch_parses_rows():
+    X = csv_to_matrix(',cgpa,iq,placement\n0,6.8,123,1\n1,5.9,106,0\n')
+    assert X.tolist() == [[6.8, 123.0], [5.9, 106.0]]
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-inf', '1e999'])
+def test_csv_batch_rejects_non_finite(value):
+    with pytest.raises(BatchError) as e:
+        csv_to_matrix(f'cgpa,iq\n6.8,123\n{value},120\n')
+    assert e.value.status == 400
+    assert 'row 3' in str(e.value)
+
+
+def test_non_utf8_upload_is_a_400():
+    client = create_app(MODEL, dataset_dir=None).test_client()
+    upload = (io.BytesIO('cgpa,iq\n6.8,123\n7.1,12\xe9\n'.encode('latin-1')), 'roster.csv')
+    response = client.post('/api/predict/batch', data={'file': upload}, content_type='multipart/form-data')
+    assert response.status_code == 400
+    assert 'UTF-8' in response.get_json()['error']
@@ -0,0 +1,55 @@
+"""An interrupted bulk run resumed with --resume ends with every row scored exactly once."""
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.synth import write_synthetic_csv
+from predictor import bulk
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+MODEL = os.path.join(ROOT, 'backend', 'model.pkl')
+ROWS = 20000
+CHUNK_BYTES = 32 * 1024
+INTERRUPT_AFTER = 3
+
+
+@pytest.fixture(scope='module')
+def roster(tmp_path_factory):
+    return write_synthetic_csv(str(tmp_path_factory.mktemp('bulk') / 'roster.csv'), ROWS)
+
+
+def read_output(path, fmt):
+    return pd.read_parquet(path) if fmt == 'parquet' else pd.read_csv(path)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet'])
+def test_resume_after_interrupt_matches_uninterrupted_run(roster, tmp_path, monkeypatch, fmt):
+    if fmt == 'parquet':
+        pytest.importorskip('pyarrow')
+    expected_path = str(tmp_path / f'expected.{fmt}')
+    bulk.bulk_score(roster, expected_path, MODEL, 1, CHUNK_BYTES, fmt)
+    expected = read_output(expected_path, fmt)
+    assert len(expected) == ROWS
+    assert len(bulk.split_ranges(roster, CHUNK_BYTES)) > INTERRUPT_AFTER + 1
+
+    score_range = bulk.score_range
+    calls = []
+
+    def interrupted(job):
+        if len(calls) == INTERRUPT_AFTER:
+            raise KeyboardInterrupt
+        calls.append(job)
+        return score_range(job)
+
+    out_path = str(tmp_path / f'scored.{fmt}')
+    monkeypatch.setattr(bulk, 'score_range', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        bulk.bulk_score(roster, out_path, MODEL, 1, CHUNK_BYTES, fmt)
+    monkeypatch.setattr(bulk, 'score_range', score_range)
+
+    rows, _ = bulk.bulk_score(roster, out_path, MODEL, 1, CHUNK_BYTES, fmt, resume=True)
+    assert 0 < rows < ROWS  # only the chunks after the checkpoint
+    scored = read_output(out_path, fmt)
+    pd.testing.assert_frame_equal(scored, expected)
+    assert not os.path.exists(bulk.progress_path_for(out_path))
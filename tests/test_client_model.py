@@ -0,0 +1,59 @@
+"""Browser-side scoring (GET /api/model) must agree with POST /api/predict."""
+import math
+import os
+import shutil
+
+import pytest
+
+from benchmarks.check_client_scorer import PAGES, extract_function, run_node, students
+from predictor.app import create_app
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+MODEL = os.path.join(ROOT, 'backend', 'model.pkl')
+TOLERANCE = 1e-9
+
+
+@pytest.fixture(scope='module')
+def client():
+    return create_app(MODEL, dataset_dir=None).test_client()
+
+
+@pytest.fixture(scope='module')
+def model(client):
+    response = client.get('/api/model')
+    assert response.status_code == 200
+    return response.get_json()
+
+
+@pytest.fixture(scope='module')
+def server(client):
+    points = students(300)
+    answers = [client.post('/api/predict?compact=1', json={'cgpa': c, 'iq': i}).get_json() for c, i in points]
+    return points, answers
+
+
+def score(model, cgpa, iq):
+    """scoreWithModel() from frontend/script.js, in Python."""
+    z = cgpa * model['coef'][0] + iq * model['coef'][1] + model['intercept']
+    p = 1 / (1 + math.exp(-z))
+    prediction = 1 if p > model['threshold'] else 0
+    return {'prediction': prediction, 'probability': p if prediction else 1 - p}
+
+
+def assert_matches(server_answers, client_answers):
+    assert len(server_answers) == len(client_answers)
+    for s, c in zip(server_answers, client_answers):
+        assert s['prediction'] == c['prediction']
+        assert abs(s['probability'] - c['probability']) <= TOLERANCE
+
+
+def test_model_coefficients_match_server(model, server):
+    points, answers = server
+    assert_matches(answers, [score(model, c, i) for c, i in points])
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+@pytest.mark.parametrize('page', PAGES, ids=lambda p: os.path.relpath(p, ROOT))
+def test_pages_match_server(page, model, server):
+    points, answers = server
+    assert_matches(answers, run_node(extract_function(page), model, points))
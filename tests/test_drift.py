@@ -0,0 +1,65 @@
+"""Drift monitor sketches under concurrent recording."""
+import sys
+import threading
+
+import numpy as np
+
+from predictor import drift
+from predictor.drift import DriftMonitor, Sketch
+
+THREADS, PER_THREAD = 12, 5000
+
+
+def test_concurrent_record_keeps_every_value(monkeypatch):
+    # Small buffers and fewer shards than threads, so threads share shards and flush often
+    monkeypatch.setattr(drift, 'FLUSH_EVERY', 7)
+    monitor = DriftMonitor(shards=3)
+    # Switch threads as often as possible to open any gap between append and flush
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        run_threads(monitor)
+    finally:
+        sys.setswitchinterval(interval)
+
+    sketches = monitor.sketches()
+    assert all(s.count == THREADS * PER_THREAD for s in sketches.values())
+    assert abs(sketches['cgpa'].mean - np.mean(np.arange(THREADS))) < 1e-9
+    assert abs(sketches['iq'].mean - 104.5) < 1e-9
+
+
+def run_threads(monitor):
+    done = threading.Event()
+
+    def work(n):
+        for i in range(PER_THREAD):
+            monitor.record(float(n), 100.0 + i % 10, 0.5)
+
+    def read():
+        while not done.is_set():
+            monitor.sketches()
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(THREADS)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    done.set()
+    reader.join()
+
+
+def test_merged_shards_match_whole_array():
+    values = np.random.default_rng(0).normal(120, 40, 10000)
+    whole, merged = Sketch('iq'), Sketch('iq')
+    whole.fold(values)
+    for part in np.array_split(values, 7):
+        shard = Sketch('iq')
+        shard.fold(part)
+        merged.merge(shard)
+    assert merged.count == whole.count == len(values)
+    assert abs(merged.mean - values.mean()) < 1e-9
+    assert abs(np.sqrt(merged.m2 / merged.count) - values.std()) < 1e-9
+    assert (merged.histogram == whole.histogram).all()
+    assert merged.quantiles() == whole.quantiles()
@@ -0,0 +1,46 @@
+"""Chunked ingestion keeps peak memory bounded by the chunk size, not the file size."""
+import tracemalloc
+
+import pytest
+
+from benchmarks.synth import write_synthetic_csv
+from predictor.dataset import iter_chunks
+
+SMALL_ROWS, LARGE_ROWS = 100000, 400000
+BASE_BYTES = 2 * 2**20  # parser buffers and pandas bookkeeping
+BYTES_PER_ROW = 100     # a chunk holds float32 + float32 + int8 per row, plus parse temporaries
+
+
+@pytest.fixture(scope='module')
+def datasets(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp('ingest')
+    paths = {rows: write_synthetic_csv(str(tmp / f'placement-{rows}.csv'), rows)
+             for rows in (SMALL_ROWS, LARGE_ROWS)}
+    # The first read imports pandas and its parser; keep that out of the measurements
+    for _ in iter_chunks(paths[SMALL_ROWS], 1000):
+        pass
+    return paths
+
+
+def peak_bytes(path, chunksize):
+    """(rows read, peak traced bytes) for one pass of iter_chunks."""
+    tracemalloc.start()
+    try:
+        rows = 0
+        for chunk in iter_chunks(path, chunksize):
+            rows += len(chunk)
+        return rows, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('chunksize', [5000, 20000])
+def test_peak_memory_depends_on_chunksize_not_file_size(datasets, chunksize):
+    ceiling = BASE_BYTES + BYTES_PER_ROW * chunksize
+    peaks = {}
+    for rows, path in datasets.items():
+        read, peaks[rows] = peak_bytes(path, chunksize)
+        assert read == rows
+        assert peaks[rows] < ceiling, f'{rows} rows peaked at {peaks[rows]} B (ceiling {ceiling} B)'
+    # 4x the rows, about the same peak
+    assert peaks[LARGE_ROWS] < 1.25 * peaks[SMALL_ROWS]
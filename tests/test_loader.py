@@ -0,0 +1,52 @@
+"""Which of model.artifact / model.scorer.json / model.pkl the servers load."""
+import os
+import pickle
+import shutil
+
+import pytest
+
+from predictor.artifact import artifact_path_for
+from predictor.loader import load_model
+from predictor.scorer import CompiledScorer, scorer_path_for
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+BACKEND = os.path.join(ROOT, 'backend')
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    for name in ('model.pkl', 'model.scorer.json', 'model.artifact'):
+        shutil.copyfile(os.path.join(BACKEND, name), tmp_path / name)
+    return str(tmp_path / 'model.pkl')
+
+
+def set_mtime(path, seconds):
+    os.utime(path, (seconds, seconds))
+
+
+def test_artifact_wins_whatever_the_mtimes(model_path):
+    # A checkout can leave the pickle a little newer than its exports
+    set_mtime(artifact_path_for(model_path), 1000000000)
+    set_mtime(scorer_path_for(model_path), 1000000000)
+    set_mtime(model_path, 1000000005)
+    model = load_model(model_path)
+    assert isinstance(model, CompiledScorer) and hasattr(model, 'threshold')
+
+
+def test_scorer_used_without_artifact(model_path):
+    os.remove(artifact_path_for(model_path))
+    set_mtime(model_path, 2000000000)
+    model = load_model(model_path)
+    assert isinstance(model, CompiledScorer) and not hasattr(model, 'threshold')
+
+
+def test_changed_pickle_beats_older_exports(model_path):
+    with open(model_path, 'rb') as f:
+        pipeline = pickle.load(f)
+    pipeline.note = 'retrained'
+    with open(model_path, 'wb') as f:
+        pickle.dump(pipeline, f)
+    # Even with exports that look newer, they no longer match the pickle
+    set_mtime(model_path, 1000000000)
+    model = load_model(model_path)
+    assert getattr(model, 'note', None) == 'retrained'
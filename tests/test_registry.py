@@ -0,0 +1,50 @@
+"""The model watcher retries until the files it saw change load cleanly."""
+import os
+import shutil
+import time
+
+import pytest
+
+from predictor import registry
+from predictor.loader import model_version
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+BACKEND = os.path.join(ROOT, 'backend')
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    for name in ('model.pkl', 'model.scorer.json', 'model.artifact'):
+        shutil.copyfile(os.path.join(BACKEND, name), tmp_path / name)
+    return str(tmp_path / 'model.pkl')
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_watcher_retries_when_export_finishes_during_a_failed_load(model_path, monkeypatch):
+    holder = registry.ModelHolder(model_path)
+    holder.load()
+    load_model = registry.load_model
+    failures = []
+
+    def load_half_written(path):
+        # The export completes while this load reads a partial file
+        if not failures:
+            failures.append(path)
+            os.utime(model_path, ns=(1, 1))
+            raise EOFError('Ran out of input')
+        return load_model(path)
+
+    monkeypatch.setattr(registry, 'load_model', load_half_written)
+    holder.start_watcher(interval=0.02)
+    os.utime(model_path, ns=(0, 0))
+    assert wait_for(lambda: holder.reloads == 1)
+    assert failures and holder.last_error is None
+    assert model_version(holder.model) is not None
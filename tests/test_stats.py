@@ -0,0 +1,54 @@
+"""/api/stats aggregates survive blank cells and outliers in the dataset."""
+import json
+
+import pandas as pd
+
+from predictor.stats import DatasetStats
+
+ROWS = """\
+,cgpa,iq,placement
+0,6.8,123,1
+1,5.9,106,0
+2,,110,0
+3,7.4,nan,1
+4,8.1,10000000000,1
+5,4.2,95,0
+"""
+
+
+def write_dataset(tmp_path, text=ROWS):
+    path = tmp_path / 'placement.csv'
+    path.write_text(text)
+    return str(path)
+
+
+def band(payload, kind, label):
+    return next(b for b in payload['bands'][kind] if b['band'] == label)
+
+
+def test_blank_and_outlier_rows_are_banded_without_failing(tmp_path):
+    payload, etag = DatasetStats(write_dataset(tmp_path)).snapshot()
+    assert etag is not None and payload['data_source'] == 'placement.csv'
+    assert payload['total_students'] == 6
+    assert payload['placed_students'] == 3
+    assert payload['unbanded_values'] == 2
+    assert sum(b['students'] for b in payload['bands']['cgpa']) == 5
+    assert sum(b['students'] for b in payload['bands']['iq']) == 5
+    assert band(payload, 'iq', '1e+10-1e+10')['students'] == 1
+    assert band(payload, 'cgpa', '5-6') == {'band': '5-6', 'students': 1, 'placed': 0, 'placement_rate': 0.0}
+
+
+def test_unterminated_nan_row_is_counted(tmp_path):
+    payload, _ = DatasetStats(write_dataset(tmp_path, ROWS + '6,,nan,1')).snapshot()
+    assert payload['total_students'] == 7
+    assert payload['unbanded_values'] == 4
+
+
+def test_means_skip_blank_cells_like_pandas(tmp_path):
+    path = write_dataset(tmp_path)
+    payload, _ = DatasetStats(path).snapshot()
+    frame = pd.read_csv(path)
+    assert payload['avg_cgpa'] == round(frame['cgpa'].mean(), 2)
+    assert payload['avg_cgpa'] == 6.48
+    assert payload['avg_iq'] == round(frame['iq'].mean(), 2)
+    json.loads(json.dumps(payload, allow_nan=False))